@@ -1,5 +1,11 @@
 # analyze_my_winrate.py
 import os
+import sys
+import copy
+import json
+import time
+import pickle
+import warnings
 import argparse
 import joblib
 import pandas as pd
@@ -8,42 +14,21 @@ from sklearn.preprocessing import OneHotEncoder
 from sklearn.pipeline import Pipeline
 from sklearn.ensemble import RandomForestClassifier
 from sklearn import model_selection, metrics
+from feature_store import normalize_role, load_features
+from champ_stats import load_champ_summary, champion_row
+from compiled_model import ARRAYS as COMPILED_ARRAYS, CompiledModel, compile_model, load_compiled
 
 CSV_PATH = "data/my_matches_ml.csv"
 MODEL_PATH = "data/my_win_model.joblib"
 
 # ---- utility ----
-def normalize_role(s: str) -> str:
-    s = (s or "").upper()
-    if s in ("BOTTOM", "BOT"):
-        return "ADC"
-    if s in ("UTILITY",):
-        return "SUPPORT"
-    if s == "MIDDLE":
-        return "MID"
-    return s or "UNKNOWN"
-
-def to_patch(ver: str) -> str:
-    # "14.20.123" -> "14.20"
-    if not isinstance(ver, str) or "." not in ver:
-        return ""
-    p = ver.split(".")
-    return f"{p[0]}.{p[1]}" if len(p) >= 2 else ver
-
 def load_df(path=CSV_PATH):
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"{path} 가 없습니다. 먼저 CSV 생성 스크립트를 실행하세요.")
-    df = pd.read_csv(path, encoding="utf-8-sig").copy()
+    # columnar store written by build_my_stats.py (role/patch already normalized)
+    df = load_features(path)
 
     for c in ["champion", "role", "runePrimary", "runeSub", "win"]:
         if c not in df.columns:
             raise ValueError(f"CSV에 '{c}' 컬럼이 없습니다.")
-
-    df["role"] = df["role"].astype(str).map(normalize_role)
-    df["patch"] = df.get("gameVersion", "").astype(str).map(to_patch)
-
-    # fill empty
-    df = df.fillna(0)
     return df
 
 def build_pipeline(cat_cols, num_cols):
@@ -68,54 +53,28 @@ NUM_COLS_ALL = [
 ]
 CAT_COLS_ALL = ["champion", "role", "runePrimary", "runeSub", "queueId", "patch"]
 
-def _safe_mode(series, default=None):
-    if len(series) == 0:
-        return default
-    s = series.dropna()
-    if s.empty:
-        return default
-    return s.mode().iloc[0]
-
-def get_feature_defaults(df: pd.DataFrame) -> dict:
-    """전체 데이터의 평균/최빈값으로 기본 피처 생성"""
-    defaults = {}
-    for c in NUM_COLS_ALL:
-        if c in df.columns:
-            defaults[c] = float(df[c].mean())
-        else:
-            defaults[c] = 0.0
-
-    defaults["runePrimary"] = int(_safe_mode(df["runePrimary"], 8000))
-    defaults["runeSub"]     = int(_safe_mode(df["runeSub"], 8300))
-    defaults["role"]        = normalize_role(str(_safe_mode(df["role"], "ADC")))
-    defaults["queueId"]     = int(_safe_mode(df["queueId"], 420))
-    defaults["patch"]       = str(_safe_mode(df["patch"], ""))
-
+def _defaults_from(src: dict) -> dict:
+    defaults = {c: float(src.get(c, 0.0)) for c in NUM_COLS_ALL}
+    defaults["runePrimary"] = int(src["rune_primary_mode"])
+    defaults["runeSub"]     = int(src["rune_sub_mode"])
+    defaults["role"]        = normalize_role(str(src["role_mode"]))
+    defaults["queueId"]     = int(src["queue_mode"])
+    defaults["patch"]       = str(src["patch_mode"])
     return defaults
 
-def get_champion_avg(df: pd.DataFrame, champion: str) -> dict | None:
+def get_feature_defaults(summary: pd.DataFrame) -> dict:
+    """전체 데이터의 평균/최빈값으로 기본 피처 생성 (요약표의 global 값)"""
+    return _defaults_from(summary.attrs["global"])
+
+def get_champion_avg(summary: pd.DataFrame, champion: str) -> dict | None:
     """해당 챔피언으로 플레이한 평균/최빈값으로 피처 구성. 없으면 None."""
-    sub = df[df["champion"] == champion]
-    if sub.empty:
+    row = champion_row(summary, champion)
+    if row is None:
         return None
-
-    defaults = {}
-    for c in NUM_COLS_ALL:
-        if c in sub.columns:
-            defaults[c] = float(sub[c].mean())
-        else:
-            defaults[c] = 0.0
-
-    defaults["runePrimary"] = int(_safe_mode(sub["runePrimary"], _safe_mode(df["runePrimary"], 8000)))
-    defaults["runeSub"]     = int(_safe_mode(sub["runeSub"], _safe_mode(df["runeSub"], 8300)))
-    defaults["role"]        = normalize_role(str(_safe_mode(sub["role"], _safe_mode(df["role"], "ADC"))))
-    defaults["queueId"]     = int(_safe_mode(sub["queueId"], _safe_mode(df["queueId"], 420)))
-    defaults["patch"]       = str(_safe_mode(sub["patch"], _safe_mode(df["patch"], "")))
-
-    return defaults
+    return _defaults_from(row)
 
 # ---- Train / Evaluate / Predict ----
-def train_and_eval(df, save_model=True, model_path=MODEL_PATH, test_size=0.2, random_state=42):
+def split_xy(df, test_size=0.2, random_state=42):
     cat_cols = CAT_COLS_ALL.copy()
     num_cols = [c for c in NUM_COLS_ALL if c in df.columns]
 
@@ -126,30 +85,86 @@ def train_and_eval(df, save_model=True, model_path=MODEL_PATH, test_size=0.2, ra
         X, y, test_size=test_size, random_state=random_state,
         stratify=y if y.nunique() == 2 else None
     )
+    return cat_cols, num_cols, X_tr, X_te, y_tr, y_te
 
-    pipe = build_pipeline(cat_cols, num_cols)
-    pipe.fit(X_tr, y_tr)
-
+def score(pipe, X_te, y_te):
     pred = pipe.predict(X_te)
     proba = pipe.predict_proba(X_te)[:, 1] if hasattr(pipe.named_steps["clf"], "predict_proba") else None
 
     acc = metrics.accuracy_score(y_te, pred)
     roc = metrics.roc_auc_score(y_te, proba) if proba is not None else None
     f1  = metrics.f1_score(y_te, pred)
+    return acc, roc, f1
+
+def train_and_eval(df, save_model=True, model_path=MODEL_PATH, test_size=0.2, random_state=42,
+                   clf_params=None):
+    cat_cols, num_cols, X_tr, X_te, y_tr, y_te = split_xy(df, test_size, random_state)
+
+    pipe = build_pipeline(cat_cols, num_cols)
+    if clf_params:
+        pipe.set_params(**{f"clf__{k}": v for k, v in clf_params.items()})
+    pipe.fit(X_tr, y_tr)
+
+    acc, roc, f1 = score(pipe, X_te, y_te)
 
     if save_model:
-        os.makedirs(os.path.dirname(model_path), exist_ok=True)
-        joblib.dump(pipe, model_path)
+        ids = df["matchId"].astype(str).tolist() if "matchId" in df.columns else []
+        save_model_files(pipe, model_path, ids)
 
     return {"acc": acc, "roc_auc": roc, "f1": f1, "n_train": len(X_tr), "n_test": len(X_te)}
 
+def model_meta_path(model_path=MODEL_PATH):
+    return os.path.splitext(model_path)[0] + ".meta.json"
+
+def load_model_meta(model_path=MODEL_PATH) -> dict | None:
+    try:
+        with open(model_meta_path(model_path), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+# forest settings chosen by --search / --prune-report --apply, kept across retrains
+TUNED_PARAMS = ["n_estimators", "max_depth", "min_samples_leaf", "max_features"]
+
+def save_model_files(pipe, model_path, match_ids, refreshes=0):
+    """joblib + 컴파일 배열 + meta (학습에 쓴 matchId, 리프레시 횟수, 트리 설정)"""
+    os.makedirs(os.path.dirname(model_path), exist_ok=True)
+    joblib.dump(pipe, model_path)
+    compile_model(pipe, model_path) # flat .npy layout next to it, loaded with mmap_mode="r"
+    clf = pipe.named_steps["clf"]
+    meta = {"trained_ids": sorted(set(match_ids)), "refreshes": refreshes,
+            "n_estimators": int(clf.n_estimators),
+            "clf_params": {k: clf.get_params()[k] for k in TUNED_PARAMS}}
+    tmp = model_meta_path(model_path) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp, model_meta_path(model_path))
+
+def saved_clf_params(model_path=MODEL_PATH, meta=None) -> dict | None:
+    """지난 학습의 트리 설정. meta 에 없으면 (이전 버전 모델) 모델 파일에서 읽음"""
+    meta = meta or load_model_meta(model_path)
+    if meta and meta.get("clf_params"):
+        return meta["clf_params"]
+    if os.path.exists(model_path):
+        clf = joblib.load(model_path).named_steps["clf"]
+        return {k: clf.get_params()[k] for k in TUNED_PARAMS}
+    return None
+
+def load_model(model_path=MODEL_PATH, compiled=False):
+    # compiled=True: flat-array model from --compile if it matches the joblib file (same predict_proba)
+    if compiled:
+        cm = load_compiled(model_path)
+        if cm is not None:
+            return cm
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"모델이 없습니다: {model_path} (먼저 --train 실행)")
+    return joblib.load(model_path)
+
 def predict_sample(model_path, champion, role, rune_primary, rune_sub,
                    kills, deaths, assists, gold_per_min, cs_per_min,
                    dmg_per_min, vision_score, xp_per_min,
                    queue_id=None, patch=None):
-    if not os.path.exists(model_path):
-        raise FileNotFoundError(f"모델이 없습니다: {model_path} (먼저 --train 실행)")
-    pipe = joblib.load(model_path)
+    pipe = load_model(model_path, compiled=True)
 
     role = normalize_role(role)
 
@@ -175,12 +190,365 @@ def predict_sample(model_path, champion, role, rune_primary, rune_sub,
     pred  = int(proba >= 0.5)
     return {"prob_win": proba, "pred_win": pred}
 
+# ---- Batch predict ----
+BATCH_CHUNK = 4096
+INT_COLS = ["runePrimary", "runeSub", "queueId"]
+
+def defaults_table(summary: pd.DataFrame) -> pd.DataFrame:
+    """챔피언별 기본 피처 (get_champion_avg 와 같은 값), index = champion"""
+    rows = {champ: get_champion_avg(summary, champ) for champ in summary.index}
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+def fill_features(chunk: pd.DataFrame, table: pd.DataFrame, glob: dict) -> pd.DataFrame:
+    # missing cells <- champion averages, unknown champion <- global defaults (same as the CLI)
+    champs = chunk["champion"].astype(str)
+    known = champs.isin(table.index).to_numpy()
+    fill = table.reindex(champs.to_numpy())
+    for c, v in glob.items():
+        fill[c] = fill[c].fillna(v) if c in fill.columns else v
+    fill.index = chunk.index
+
+    X = pd.DataFrame({"champion": champs}, index=chunk.index)
+    missing = pd.Series(False, index=chunk.index)
+    for c in CAT_COLS_ALL[1:] + NUM_COLS_ALL:
+        if c in chunk.columns:
+            col = chunk[c].replace("", None)
+            if c in NUM_COLS_ALL or c in INT_COLS:
+                col = pd.to_numeric(col, errors="coerce") # "abc" / "n/a" -> NaN -> filled like an empty cell
+            missing |= col.isna()
+            X[c] = col.where(col.notna(), fill[c])
+        else:
+            missing[:] = True
+            X[c] = fill[c]
+
+    X["role"] = X["role"].astype(str).map(normalize_role)
+    for c in INT_COLS:
+        X[c] = pd.to_numeric(X[c], errors="coerce").fillna(0).astype("int64")
+    X["patch"] = X["patch"].astype(str)
+    for c in NUM_COLS_ALL:
+        X[c] = pd.to_numeric(X[c], errors="coerce").astype("float64")
+
+    X["fill"] = ""
+    X.loc[missing.to_numpy() & known, "fill"] = "champion_avg"
+    X.loc[missing.to_numpy() & ~known, "fill"] = "global_defaults"
+    return X
+
+def read_batches(src: str, fmt="auto", chunksize=BATCH_CHUNK):
+    """CSV / JSONL 파일 또는 '-'(stdin) 을 chunksize 행씩 DataFrame 으로"""
+    stream = sys.stdin if src == "-" else src
+    if fmt == "auto":
+        if src == "-":
+            head = sys.stdin.buffer.peek(1)[:1]
+            fmt = "jsonl" if head in (b"{", b"[") else "csv"
+        else:
+            fmt = "jsonl" if src.endswith((".jsonl", ".json", ".ndjson")) else "csv"
+    if fmt == "jsonl":
+        reader = pd.read_json(stream, lines=True, chunksize=chunksize, dtype=False)
+    else:
+        reader = pd.read_csv(stream, chunksize=chunksize, dtype=str) # echoed back as given
+    with reader:
+        yield from reader
+
+def predict_batch(model_path, src, csv_path=CSV_PATH, out=None, fmt="auto", chunksize=BATCH_CHUNK):
+    """모델/요약표를 한 번만 로드하고 chunk 단위 predict_proba, 결과는 CSV 로 바로 흘려보냄"""
+    out = out or sys.stdout
+    t0 = time.perf_counter()
+    pipe = load_model(model_path)
+    summary = load_champ_summary(csv_path)
+    table = defaults_table(summary)
+    glob = get_feature_defaults(summary)
+    t_load = time.perf_counter() - t0
+
+    n, t_pred, header, cols = 0, 0.0, True, []
+    t1 = time.perf_counter()
+    for chunk in read_batches(src, fmt, chunksize):
+        cols = list(chunk.columns)
+        if chunk.empty: # header-only input: nothing to predict, sklearn rejects 0 samples
+            continue
+        if "champion" not in chunk.columns:
+            raise ValueError("입력에 'champion' 컬럼이 없습니다.")
+        X = fill_features(chunk, table, glob)
+        tp = time.perf_counter()
+        proba = pipe.predict_proba(X[CAT_COLS_ALL + NUM_COLS_ALL])[:, 1]
+        t_pred += time.perf_counter() - tp
+
+        # input columns as given + how they were filled + result (formatting every filled float dominates otherwise)
+        res = chunk.assign(fill=X["fill"], prob_win=proba.round(4), pred_win=(proba >= 0.5).astype(int))
+        res.to_csv(out, header=header, index=False)
+        out.flush()
+        header = False
+        n += len(res)
+    if header: # no rows at all: still write the output header
+        pd.DataFrame(columns=cols + ["fill", "prob_win", "pred_win"]).to_csv(out, index=False)
+    t_all = time.perf_counter() - t1
+
+    rate = n / (t_all * 1000) if t_all > 0 else 0.0
+    print(f"[BATCH] rows={n}  load={t_load*1000:.0f}ms  predict={t_pred*1000:.0f}ms  total={t_all*1000:.0f}ms"
+          f"  ({rate:.1f} rows/ms)", file=sys.stderr)
+    return n
+
+# ---- Compiled model ----
+def compile_and_check(model_path=MODEL_PATH, csv_path=CSV_PATH, tol=1e-12, repeat=200):
+    """joblib 파이프라인 -> 배열 모델로 컴파일하고, 학습 CSV 전체 + 미지 카테고리 행 + NaN 행으로 sklearn 과 비교"""
+    pipe = load_model(model_path)
+    out = compile_model(pipe, model_path)
+    cm = load_compiled(model_path)
+
+    df = load_df(csv_path)
+    X = df[CAT_COLS_ALL + [c for c in NUM_COLS_ALL if c in df.columns]].copy()
+    unk = X.head(50).copy() # unseen champion / patch -> all-zero one-hot, like handle_unknown="ignore"
+    unk["champion"] = "__unknown__"
+    unk["patch"] = "0.0"
+    nan = X.head(50).copy() # missing numbers: routed by each split's missing_go_to_left
+    num = [c for c in NUM_COLS_ALL if c in nan.columns]
+    for i, c in enumerate(num):
+        nan.iloc[i::len(num), nan.columns.get_loc(c)] = float("nan")
+    nan.iloc[::7, [nan.columns.get_loc(c) for c in num]] = float("nan")
+    X = pd.concat([X.astype(object), unk.astype(object), nan.astype(object)], ignore_index=True)
+
+    diff = float(abs(cm.predict_proba(X) - pipe.predict_proba(X)).max())
+    if diff > tol:
+        raise AssertionError(f"컴파일 모델 결과가 다릅니다: max |diff| = {diff:.3g}")
+
+    row = X.iloc[[0]]
+    timings = {}
+    for name, model in (("sklearn", pipe), ("compiled", cm)):
+        model.predict_proba(row)
+        t = time.perf_counter()
+        for _ in range(repeat):
+            model.predict_proba(row)
+        timings[name] = (time.perf_counter() - t) / repeat * 1000
+
+    size = sum(os.path.getsize(os.path.join(out, f)) for f in os.listdir(out))
+    return {"path": out, "rows": len(X), "max_diff": diff, "ms_sklearn": timings["sklearn"],
+            "ms_compiled": timings["compiled"], "bytes_joblib": os.path.getsize(model_path), "bytes_compiled": size}
+
+def bench_load(model_path=MODEL_PATH, runs=5):
+    """joblib / compiled(복사) / compiled(mmap) 로드를 각각 새 프로세스에서 측정"""
+    import statistics
+    import subprocess
+    if load_compiled(model_path) is None:
+        compile_model(load_model(model_path), model_path)
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+    for kind in ("joblib", "compiled", "mmap"):
+        rs = []
+        for _ in range(runs):
+            p = subprocess.run([sys.executable, os.path.join(here, "compiled_model.py"), "--probe", kind, model_path],
+                               capture_output=True, text=True, check=True)
+            rs.append(json.loads(p.stdout.strip().splitlines()[-1]))
+        results[kind] = {k: statistics.median(r[k] for r in rs) for k in rs[0] if k != "kind"}
+    return results
+
+# ---- Forest size / latency trade-off ----
+PRUNE_REPORT_PATH = "data/prune_report.csv"
+PRUNE_DEPTHS = [4, 6, 8, 10, 12]
+PRUNE_TREES = [10, 20, 40, 60, 100, 150, 200, 300]
+
+def subset_forest(pipe, n_trees):
+    """학습된 포레스트의 앞 n_trees 개 트리만 쓰는 파이프라인 (재학습 없음)"""
+    clf = copy.copy(pipe.named_steps["clf"])
+    clf.estimators_ = clf.estimators_[:n_trees]
+    clf.n_estimators = n_trees
+    return Pipeline(steps=[("prep", pipe.named_steps["prep"]), ("clf", clf)])
+
+def _median_ms(fn, repeat):
+    fn()
+    ts = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        ts.append((time.perf_counter() - t) * 1000)
+    return sorted(ts)[len(ts) // 2]
+
+def prune_report(df, depths=PRUNE_DEPTHS, trees=PRUNE_TREES, repeat=20, random_state=42):
+    """깊이별로 한 번 학습 -> 트리 수는 앞에서부터 잘라서 정확도/지연/크기 측정"""
+    cat_cols, num_cols, X_tr, X_te, y_tr, y_te = split_xy(df, random_state=random_state)
+    row = X_te.iloc[[0]]
+    rows = []
+    for depth in depths:
+        full = build_pipeline(cat_cols, num_cols)
+        full.set_params(clf__n_estimators=max(trees), clf__max_depth=depth)
+        full.fit(X_tr, y_tr)
+        for k in trees:
+            pipe = subset_forest(full, k)
+            cm = CompiledModel.from_pipeline(pipe)
+            acc, roc, f1 = score(pipe, X_te, y_te)
+            rows.append({
+                "max_depth": depth, "n_trees": k,
+                "acc": acc, "roc_auc": roc, "f1": f1,
+                "row_ms_sklearn": _median_ms(lambda: pipe.predict_proba(row), repeat),
+                "row_ms_compiled": _median_ms(lambda: cm.predict_proba(row), repeat),
+                "batch_ms_sklearn": _median_ms(lambda: pipe.predict_proba(X_te), max(3, repeat // 4)),
+                "bytes_joblib": len(pickle.dumps(pipe, protocol=pickle.HIGHEST_PROTOCOL)),
+                "bytes_compiled": sum(getattr(cm, a).nbytes for a in COMPILED_ARRAYS),
+                "nodes": int(len(cm.feature)),
+            })
+    return pd.DataFrame(rows), (cat_cols, num_cols, X_tr, y_tr)
+
+def pick_model(report, latency_ms=None, max_mb=None, tol=0.01, metric="roc_auc"):
+    """예산(1행 지연 = 컴파일 경로, 컴파일 크기) 안에서 최고 점수 - tol 이상인 가장 작은 모델"""
+    best = report[metric].max()
+    ok = report[report[metric] >= best - tol]
+    if latency_ms is not None:
+        ok = ok[ok["row_ms_compiled"] <= latency_ms]
+    if max_mb is not None:
+        ok = ok[ok["bytes_compiled"] <= max_mb * 1e6]
+    if ok.empty:
+        return None
+    return ok.sort_values(["bytes_compiled", "row_ms_compiled"]).iloc[0]
+
+# ---- Hyperparameter search ----
+SEARCH_REPORT_PATH = "data/search_report.csv"
+SEARCH_CACHE_DIR = "data/.search_cache"
+SEARCH_GRID = {
+    "clf__n_estimators": [100, 300],
+    "clf__max_depth": [6, 8, 12, None],
+    "clf__min_samples_leaf": [1, 3, 5],
+    "clf__max_features": ["sqrt", 0.5],
+}
+
+def time_order(df):
+    # matchId "KR_7312345678": the number grows with time -> oldest game first
+    seq = pd.to_numeric(df["matchId"].astype(str).str.extract(r"(\d+)$")[0], errors="coerce")
+    return df.assign(_seq=seq).sort_values("_seq", kind="mergesort").drop(columns="_seq")
+
+def search(df, cv="kfold", folds=5, grid=None, n_jobs=-1, random_state=42):
+    """교차 검증 + successive halving 으로 그리드 탐색. 전처리는 fold 마다 한 번만 학습 (Pipeline memory)"""
+    from joblib import Memory
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+    from sklearn.model_selection import HalvingGridSearchCV, StratifiedKFold, TimeSeriesSplit
+
+    if cv == "time":
+        if "matchId" not in df.columns:
+            raise ValueError("시간순 분할에는 'matchId' 컬럼이 필요합니다.")
+        df = time_order(df)
+        splitter = TimeSeriesSplit(n_splits=folds) # train on the past, score on the next block
+    else:
+        splitter = StratifiedKFold(n_splits=folds, shuffle=True, random_state=random_state)
+
+    cat_cols = CAT_COLS_ALL.copy()
+    num_cols = [c for c in NUM_COLS_ALL if c in df.columns]
+    X = df[cat_cols + num_cols]
+    y = df["win"].astype(int)
+
+    pipe = build_pipeline(cat_cols, num_cols)
+    pipe.set_params(clf__n_jobs=1) # parallelism comes from the search, not the forest
+    # candidates that only differ in clf__* reuse the fitted ColumnTransformer of the same fold
+    pipe.memory = Memory(SEARCH_CACHE_DIR, verbose=0)
+
+    gs = HalvingGridSearchCV(
+        pipe, grid or SEARCH_GRID, cv=splitter, scoring="roc_auc", factor=3,
+        n_jobs=n_jobs, random_state=random_state, refit=False,
+        error_score=float("nan"), # a small early-rung fold with one class can't be scored -> ranked last
+    )
+    t0 = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning) # per-fold "fit failed" / nan score warnings
+        gs.fit(X, y)
+    wall = time.perf_counter() - t0
+    pipe.memory.clear(warn=False)
+
+    res = pd.DataFrame(gs.cv_results_)
+    n_splits = gs.n_splits_
+    report = pd.DataFrame({
+        "iter": res["iter"],
+        "n_samples": res["n_resources"],
+        "mean_roc_auc": res["mean_test_score"],
+        "std_roc_auc": res["std_test_score"],
+        "fit_s_per_fold": res["mean_fit_time"],
+        "wall_s": (res["mean_fit_time"] + res["mean_score_time"]) * n_splits,
+        "rank": res["rank_test_score"],
+    })
+    for k in (grid or SEARCH_GRID):
+        report[k.replace("clf__", "")] = res[f"param_{k}"].astype(object)
+    report = report.sort_values(["iter", "mean_roc_auc"], ascending=[False, False])
+    best = {k.replace("clf__", ""): v for k, v in gs.best_params_.items()}
+    return report, best, gs.best_score_, wall
+
+# ---- Incremental refresh ----
+REFRESH_TREES = 30    # trees grown on the recent window per refresh, the oldest 30 are retired
+REFRESH_WINDOW = 300  # older games added to the new ones so a handful of games can still grow trees
+
+def vocab_drift(pipe, df) -> list:
+    """학습 때 없던 카테고리 (새 챔피언, 새 패치 등) -> [(컬럼, 값), ...]"""
+    prep = pipe.named_steps["prep"]
+    cols = [c for name, _, c in prep.transformers_ if name == "cat"][0]
+    cats = prep.named_transformers_["cat"].categories_
+    out = []
+    for col, known in zip(cols, cats):
+        known = {str(v) for v in known}
+        out += [(col, v) for v in sorted({str(v) for v in df[col].astype(object)} - known)]
+    return out
+
+def refresh_model(df, model_path=MODEL_PATH, new_trees=REFRESH_TREES, window=REFRESH_WINDOW):
+    """새 경기만으로 트리 new_trees 개를 추가(warm_start)하고 가장 오래된 트리를 같은 수만큼 제거.
+    어휘가 바뀌었거나 윈도가 한 클래스뿐이면 전체 재학습."""
+    t0 = time.perf_counter()
+    meta = load_model_meta(model_path)
+    params = saved_clf_params(model_path, meta) # a full retrain keeps the chosen forest size
+    if meta is None or not os.path.exists(model_path) or "matchId" not in df.columns:
+        r = train_and_eval(df, save_model=True, model_path=model_path, clf_params=params)
+        return {"mode": "full", "reason": "이전 학습 기록 없음", "n_new": len(df), "seconds": time.perf_counter() - t0, **r}
+
+    trained = set(meta["trained_ids"])
+    ids = df["matchId"].astype(str)
+    is_new = ~ids.isin(trained)
+    n_new = int(is_new.sum())
+    if n_new == 0:
+        return {"mode": "none", "reason": "새 경기 없음", "n_new": 0, "seconds": time.perf_counter() - t0}
+
+    pipe = joblib.load(model_path)
+    drift = vocab_drift(pipe, df[is_new])
+    # recent window: every new game + the latest `window` already-trained games
+    ordered = time_order(df.assign(_new=is_new.to_numpy()))
+    win_df = pd.concat([ordered[~ordered["_new"]].tail(window), ordered[ordered["_new"]]])
+    y = win_df["win"].astype(int)
+    reason = None
+    if drift:
+        shown = ", ".join(f"{c}={v}" for c, v in drift[:5])
+        reason = f"새 카테고리 {len(drift)}개 ({shown})"
+    elif y.nunique() < 2:
+        reason = "최근 윈도에 승/패 한쪽만 있음"
+    if reason:
+        r = train_and_eval(df, save_model=True, model_path=model_path, clf_params=params)
+        return {"mode": "full", "reason": reason, "n_new": n_new, "seconds": time.perf_counter() - t0, **r}
+
+    prep, clf = pipe.named_steps["prep"], pipe.named_steps["clf"]
+    base = len(clf.estimators_)
+    k = min(new_trees, base)
+    Xw = prep.transform(win_df[CAT_COLS_ALL + [c for c in NUM_COLS_ALL if c in df.columns]]) # vocabulary stays fixed
+    refreshes = meta.get("refreshes", 0) + 1
+    clf.set_params(warm_start=True, n_estimators=base + k, random_state=42 + refreshes)
+    clf.fit(Xw, y)
+    clf.estimators_ = clf.estimators_[k:] # retire the oldest trees, size stays constant
+    clf.set_params(warm_start=False, n_estimators=base)
+
+    save_model_files(pipe, model_path, list(trained) + ids[is_new].tolist(), refreshes)
+    return {"mode": "incremental", "reason": f"트리 {k}개 교체 (윈도 {len(win_df)}경기)", "n_new": n_new,
+            "seconds": time.perf_counter() - t0, "refreshes": refreshes}
+
 # ---- CLI ----
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--train", action="store_true", help="모델 학습/평가 후 저장")
     ap.add_argument("--csv", default=CSV_PATH, help="CSV 경로")
     ap.add_argument("--model", default=MODEL_PATH, help="모델 저장/로드 경로")
+    ap.add_argument("--compile", action="store_true", help="모델을 배열 형태로 컴파일 + sklearn 결과와 동일한지 검사")
+    ap.add_argument("--bench-load", action="store_true", help="모델 로드 시간/RSS 비교 (joblib vs 컴파일 vs mmap)")
+    ap.add_argument("--prune-report", action="store_true", help="트리 수/깊이별 정확도·지연·크기 비교 후 예산 안의 가장 작은 모델 선택")
+    ap.add_argument("--latency-ms", type=float, help="--prune-report: 1행 예측 지연 예산 (컴파일 모델 기준)")
+    ap.add_argument("--max-mb", type=float, help="--prune-report: 모델 크기 예산 (MB)")
+    ap.add_argument("--tol", type=float, default=0.01, help="--prune-report: 최고 ROC-AUC 대비 허용 하락폭")
+    ap.add_argument("--apply", action="store_true", help="--prune-report / --search: 선택된 설정으로 다시 학습해 저장")
+    ap.add_argument("--search", action="store_true", help="교차 검증 + successive halving 하이퍼파라미터 탐색")
+    ap.add_argument("--cv", choices=["kfold", "time"], default="kfold", help="--search: 층화 k-fold / 시간순 분할")
+    ap.add_argument("--folds", type=int, default=5)
+    ap.add_argument("--refresh", action="store_true", help="새 경기만으로 모델 갱신 (필요하면 자동 전체 재학습)")
+    ap.add_argument("--batch", metavar="FILE", help="CSV/JSONL 여러 행 일괄 예측 ('-' 는 stdin)")
+    ap.add_argument("--format", choices=["auto", "csv", "jsonl"], default="auto", help="--batch 입력 형식")
+    ap.add_argument("--out", help="--batch 결과 CSV 경로 (기본 stdout)")
 
     ap.add_argument("--champion")
     ap.add_argument("--role")
@@ -209,6 +577,68 @@ def main():
             print(f"  - roc_auc: {report['roc_auc']:.3f}")
         print(f"  - f1: {report['f1']:.3f}")
 
+    # incremental refresh
+    if args.refresh:
+        r = refresh_model(load_df(args.csv), args.model)
+        print(f"[REFRESH] {r['mode']}: {r['reason']}  new={r['n_new']}  {r['seconds']:.2f}s")
+        if r["mode"] == "full":
+            print(f"  - acc: {r['acc']:.3f}  f1: {r['f1']:.3f}")
+
+    # compile + parity check
+    if args.compile:
+        r = compile_and_check(args.model, args.csv)
+        print(f"[COMPILE] {r['path']}  rows={r['rows']}  max|diff|={r['max_diff']:.3g}")
+        print(f"  - 1행 예측: sklearn {r['ms_sklearn']:.2f} ms -> compiled {r['ms_compiled']:.3f} ms")
+        print(f"  - 크기: joblib {r['bytes_joblib']/1e6:.2f} MB -> compiled {r['bytes_compiled']/1e6:.2f} MB")
+
+    if args.bench_load:
+        res = bench_load(args.model)
+        print(f"{'형식':<10}{'import':>10}{'load':>10}{'RSS':>10}{'anon':>10}{'file':>10}{'예측 후 RSS':>14}")
+        for kind, r in res.items():
+            print(f"{kind:<10}{r['import_ms']:>8.1f}ms{r['load_ms']:>8.1f}ms{r['rss_kb']/1024:>8.1f}MB"
+                  f"{r['anon_kb']/1024:>8.1f}MB{r['file_kb']/1024:>8.1f}MB{r['rss_after_predict_kb']/1024:>12.1f}MB")
+
+    if args.prune_report:
+        df = load_df(args.csv)
+        report, _ = prune_report(df)
+        os.makedirs(os.path.dirname(PRUNE_REPORT_PATH), exist_ok=True)
+        report.to_csv(PRUNE_REPORT_PATH, index=False, encoding="utf-8-sig")
+        print(report.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+        print(f"→ {PRUNE_REPORT_PATH}")
+
+        pick = pick_model(report, args.latency_ms, args.max_mb, args.tol)
+        if pick is None:
+            print("[PRUNE] 예산을 만족하는 모델이 없습니다.")
+        else:
+            print(f"[PRUNE] 선택: max_depth={int(pick['max_depth'])} n_trees={int(pick['n_trees'])}"
+                  f"  roc_auc={pick['roc_auc']:.3f} (최고 {report['roc_auc'].max():.3f})"
+                  f"  1행 {pick['row_ms_compiled']:.3f} ms  {pick['bytes_compiled']/1e6:.2f} MB")
+            if args.apply:
+                r = train_and_eval(df, save_model=True, model_path=args.model,
+                                   clf_params={"n_estimators": int(pick["n_trees"]), "max_depth": int(pick["max_depth"])})
+                print(f"[PRUNE] 저장: {args.model}  acc={r['acc']:.3f}  f1={r['f1']:.3f}")
+
+    if args.search:
+        df = load_df(args.csv)
+        report, best, best_score, wall = search(df, cv=args.cv, folds=args.folds)
+        os.makedirs(os.path.dirname(SEARCH_REPORT_PATH), exist_ok=True)
+        report.to_csv(SEARCH_REPORT_PATH, index=False, encoding="utf-8-sig")
+        print(report.head(15).to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+        print(f"[SEARCH] cv={args.cv} folds={args.folds}  후보 {len(report)}회 평가, {wall:.1f}s  → {SEARCH_REPORT_PATH}")
+        print(f"[SEARCH] 최고 roc_auc={best_score:.3f}  {best}")
+        if args.apply:
+            r = train_and_eval(df, save_model=True, model_path=args.model, clf_params=best)
+            print(f"[SEARCH] 저장: {args.model}  acc={r['acc']:.3f}  f1={r['f1']:.3f}")
+
+    # batch predict
+    if args.batch:
+        if args.out:
+            with open(args.out, "w", encoding="utf-8", newline="") as f:
+                predict_batch(args.model, args.batch, args.csv, out=f, fmt=args.format)
+        else:
+            predict_batch(args.model, args.batch, args.csv, fmt=args.format)
+        return
+
     # predict
     provided = [
         args.champion, args.role, args.runePrimary, args.runeSub,
@@ -228,15 +658,15 @@ def main():
             print(f"[PREDICT] prob_win={out['prob_win']*100:.1f}%  pred_win={out['pred_win']}")
         else:
             # some input
-            df = load_df(args.csv)
+            summary = load_champ_summary(args.csv)
             # role normalize
             role_in = normalize_role(args.role) if args.role else None
 
             # champion mean
-            defaults = get_champion_avg(df, args.champion)
+            defaults = get_champion_avg(summary, args.champion)
             used = "champion_avg"
             if defaults is None:
-                defaults = get_feature_defaults(df)
+                defaults = get_feature_defaults(summary)
                 used = "global_defaults"
 
             # input data and defaults
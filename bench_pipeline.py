@@ -0,0 +1,225 @@
+# bench_pipeline.py
+import os, io, sys, json, time, argparse, platform, statistics, subprocess, threading, contextlib
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_PATH = os.path.join(REPO_DIR, "data", "bench_results.jsonl")
+BENCH_DIR = os.path.join(REPO_DIR, "data", "bench")
+STAGES = ["generate", "parse", "features", "load_csv", "load_columnar", "train",
+          "predict_single", "predict_single_compiled", "predict_batch", "summary", "core_items"]
+DEFAULT_SIZES = [1000, 10000]
+
+# ---- memory ----
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource # no /proc: peak of the whole process, coarser
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+class PeakRSS:
+    """with 블록 동안 RSS 를 샘플링해서 시작 대비 최대 증가량(MB)을 기록"""
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._peak = max(self._peak, _rss_bytes())
+
+    def __enter__(self):
+        self._start = self._peak = _rss_bytes()
+        self._t = threading.Thread(target=self._run, daemon=True)
+        self._t.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._t.join()
+        self._peak = max(self._peak, _rss_bytes())
+        self.peak_mb = (self._peak - self._start) / 1024 / 1024
+
+# ---- commit info ----
+def git_info() -> dict:
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], cwd=REPO_DIR, capture_output=True, text=True, timeout=30).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return ""
+    return {"commit": git("rev-parse", "--short", "HEAD") or "unknown",
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+# ---- stages ----
+def _quiet():
+    # the pipeline scripts print progress / head(); keep the bench output readable
+    return contextlib.redirect_stdout(io.StringIO())
+
+def run_stages(n, seed, stages, repeat=50):
+    """work dir (data/bench/n<size>_s<seed>) 안에서 파이프라인 단계별 (초, 최대 RSS 증가 MB, 행 수)"""
+    import pandas as pd, numpy as np
+    import synth_matches, build_my_stats, champ_stats, feature_store
+    import analyze_my_winrate as amw
+    from match_store import STORE_PATH
+
+    work = os.path.join(BENCH_DIR, f"n{n}_s{seed}")
+    os.makedirs(work, exist_ok=True)
+    prev = os.getcwd()
+    os.chdir(work) # every script uses relative data/ paths
+    try:
+        puuid = synth_matches.SYNTH_PUUID
+        results = []
+
+        def timed(stage, fn):
+            if stage not in stages:
+                return None
+            with PeakRSS() as mem:
+                t0 = time.perf_counter()
+                out = fn()
+                sec = time.perf_counter() - t0
+            rows, extra = out if isinstance(out, tuple) else (out, {})
+            results.append({"stage": stage, "seconds": round(sec, 6), "peak_mb": round(mem.peak_mb, 2),
+                            "rows": rows, **extra})
+            more = "".join(f"  {k}={v}" for k, v in extra.items())
+            print(f"  {stage:<24} {sec * 1000:10.1f} ms  peak +{mem.peak_mb:7.1f} MB  rows={rows}{more}")
+            return out
+
+        # generated data is kept between runs (same n, seed -> same matches)
+        if not os.path.exists(STORE_PATH):
+            stages = set(stages) | {"generate"} # later stages need the store, whatever --stages says
+            timed("generate", lambda: synth_matches.write_matches(n, STORE_PATH, puuid, seed, progress=False) and n)
+        elif "generate" in stages:
+            print(f"  {'generate':<24} (캐시 사용: {work})")
+
+        timed("parse", lambda: sum(1 for _ in build_my_stats.open_matches(puuid)))
+        if "features" in stages or not os.path.exists(build_my_stats.OUT_CSV):
+            stages = set(stages) | {"features"}
+            def features():
+                with _quiet():
+                    build_my_stats.main(full=True, puuid=puuid)
+                return n
+            timed("features", features)
+
+        csv_path = build_my_stats.OUT_CSV
+        timed("load_csv", lambda: len(pd.read_csv(csv_path, encoding="utf-8-sig")))
+        timed("load_columnar", lambda: len(feature_store.load_features(csv_path)))
+        df = amw.load_df(csv_path)
+
+        if "train" in stages or not os.path.exists(amw.MODEL_PATH):
+            stages = set(stages) | {"train"}
+            def train():
+                m = amw.train_and_eval(df, save_model=True, model_path=amw.MODEL_PATH)
+                return m["n_train"], {"roc_auc": round(m["roc_auc"], 4)}
+            timed("train", train)
+
+        summary = champ_stats.load_champ_summary(csv_path, df=df)
+        one = amw.fill_features(pd.DataFrame([{"champion": "Jinx"}]), amw.defaults_table(summary),
+                                amw.get_feature_defaults(summary))[amw.CAT_COLS_ALL + amw.NUM_COLS_ALL]
+
+        def single(compiled):
+            def run():
+                model = amw.load_model(amw.MODEL_PATH, compiled=compiled)
+                model.predict_proba(one) # first call pays lazy init
+                ms = []
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    model.predict_proba(one)
+                    ms.append((time.perf_counter() - t0) * 1000)
+                return repeat, {"median_ms": round(statistics.median(ms), 4)}
+            return run
+        timed("predict_single", single(False))
+        timed("predict_single_compiled", single(True))
+
+        def batch():
+            with contextlib.redirect_stderr(io.StringIO()):
+                return amw.predict_batch(amw.MODEL_PATH, csv_path, csv_path, out=io.StringIO())
+        timed("predict_batch", batch)
+
+        timed("summary", lambda: len(champ_stats.build_champ_summary(df)))
+        lookup = np.zeros(max(synth_matches.CORE_ITEMS) + 1, dtype=bool)
+        lookup[synth_matches.CORE_ITEMS] = True
+        timed("core_items", lambda: len(champ_stats.top_core_items_by_champ(df, lookup)))
+    finally: # an error in a stage must not leave the process in the bench dir
+        os.chdir(prev)
+    return results
+
+# ---- results ----
+def save_results(results, n, seed, info, path=RESULTS_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    ts = time.strftime("%Y-%m-%dT%H:%M:%S")
+    with open(path, "a", encoding="utf-8") as f:
+        for r in results:
+            f.write(json.dumps({**info, "ts": ts, "size": n, "seed": seed, **r,
+                                "python": platform.python_version()}, ensure_ascii=False) + "\n")
+
+def load_results(path=RESULTS_PATH) -> list:
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def latest_by_commit(records, commit) -> dict:
+    # (size, stage) -> most recent record of that commit
+    out = {}
+    for r in records:
+        if r["commit"] == commit:
+            out[(r["size"], r["stage"])] = r
+    return out
+
+def compare(base, head=None, path=RESULTS_PATH, threshold=0.10):
+    """두 커밋의 최근 결과 비교. threshold 이상 느려진 단계는 [느려짐] 표시"""
+    records = load_results(path)
+    head = head or git_info()["commit"]
+    if base == "prev": # the last commit recorded before head
+        seen = [r["commit"] for r in records if r["commit"] != head]
+        if not seen:
+            print("비교할 이전 커밋 결과가 없습니다.")
+            return 0
+        base = seen[-1]
+    a, b = latest_by_commit(records, base), latest_by_commit(records, head)
+    keys = sorted(set(a) & set(b), key=lambda k: (k[0], STAGES.index(k[1]) if k[1] in STAGES else 99))
+    if not keys:
+        print(f"{base} 와 {head} 에 공통 결과가 없습니다.")
+        return 0
+    print(f"[compare] {base} -> {head}")
+    slower = 0
+    for size, stage in keys:
+        old, new = a[(size, stage)], b[(size, stage)]
+        ratio = new["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+        flag = "  [느려짐]" if ratio > 1 + threshold else ""
+        slower += bool(flag)
+        print(f"  n={size:<8} {stage:<24} {old['seconds'] * 1000:10.1f} -> {new['seconds'] * 1000:10.1f} ms"
+              f"  x{ratio:5.2f}  mem {old['peak_mb']:7.1f} -> {new['peak_mb']:7.1f} MB{flag}")
+    return slower
+
+def main():
+    ap = argparse.ArgumentParser(description="가짜 매치 데이터로 전체 파이프라인 단계별 시간/메모리 측정")
+    ap.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="매치 수 (예: 1000 10000 100000)")
+    ap.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--repeat", type=int, default=50, help="단일 예측 반복 횟수")
+    ap.add_argument("--no-save", action="store_true", help=f"{RESULTS_PATH} 에 기록하지 않음")
+    ap.add_argument("--compare", nargs="?", const="prev", metavar="COMMIT",
+                    help="측정 없이 결과 비교 (기본: 직전에 기록된 커밋 vs 현재 커밋)")
+    ap.add_argument("--threshold", type=float, default=0.10, help="느려짐 표시 기준 (0.10 = 10%%)")
+    args = ap.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(args.compare, threshold=args.threshold) else 0)
+
+    sys.path.insert(0, REPO_DIR) # scripts are imported after chdir into the work dir
+    info = git_info()
+    print(f"[bench] commit={info['commit']}{' (dirty)' if info['dirty'] else ''}  python={platform.python_version()}")
+    for n in args.sizes:
+        print(f"[bench] n={n}")
+        results = run_stages(n, args.seed, args.stages, args.repeat)
+        if not args.no_save:
+            save_results(results, n, args.seed, info)
+    if not args.no_save:
+        print(f"결과 저장: {RESULTS_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -1,101 +1,243 @@
-import os, json
-import collections
+import os, json, time, shutil, argparse
 import pandas as pd
-from secret_config import MY_PUUID
+from match_store import STORE_PATH, LEGACY_JSONL_PATH, open_store
+from feature_store import write_features, append_features, source_signature, load_features
+from champ_stats import build_champ_summary, write_champ_summary
 
-def open_jsonl(path):
-    with open(path, encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                yield json.loads(line)
+# optional faster JSON backend
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+# ---- projection ----
+# a regex / raw_decode projection of one participant measured slower than a full parse
+# (orjson and stdlib alike: the field search scans past every participant), so parse once and index
+INFO_FIELDS = ("gameDuration", "gameVersion", "queueId")
+
+def project_match(line: str, puuid: str) -> dict:
+    """raw JSON 한 줄 -> matchId, info 헤더, 내 participant 만 남긴 dict (전체 파싱 후 필요한 부분만 유지)"""
+    raw = _loads(line)
+    info = raw.get("info", {})
+    me = next((p for p in info.get("participants", []) if p.get("puuid") == puuid), None)
+    return {
+        "metadata": {"matchId": raw.get("metadata", {}).get("matchId")},
+        "info": {**{k: info[k] for k in INFO_FIELDS if k in info},
+                 "participants": [me] if me is not None else []},
+    }
+
+def open_matches(puuid=None, skip=()):
+    # compressed store; a plain jsonl from older runs is converted on first read
+    if not (os.path.exists(STORE_PATH) or os.path.exists(LEGACY_JSONL_PATH)):
+        return
+    store = open_store()
+    # with skip, only the new frames are read through the index
+    lines = store.iter_raw_ids(store.ids() - set(skip)) if skip else store.iter_raw()
+    for line in lines:
+        yield project_match(line, puuid) if puuid is not None else _loads(line)
 
 #second -> minute
 def per_min(value, dur_sec): return value / max(dur_sec / 60.0, 1e-9)
 
-#most item series
-def top_items(series, topk=6):
-    bag = collections.Counter()
-    for lst in series:
-        for it in lst:
-            if it and it != 0:
-                bag[it] += 1
-    return [it for it, _ in bag.most_common(topk)]
-
-def main():
-    PATH = "data/my_matches_raw.jsonl"
-    if not os.path.exists(PATH):
-        raise FileNotFoundError(f"{PATH}가 없습니다. 먼저 load_my_matches.py를 실행하세요.")
-    
-    #---- get data, make DataFrame
-    rows = []
-    for raw in open_jsonl(PATH):
-        info = raw["info"]
-        meta = raw["metadata"]
-        dur = info.get("gameDuration", 0)
-        parts = info.get("participants", [])
-
-        #only my data
-        me = next((p for p in parts if p.get("puuid") == MY_PUUID), None)        
-        if me is None:
-            continue
-
-        k = me.get("kills", 0)
-        d = me.get("deaths", 0)
-        a = me.get("assists", 0)
-        cs = me.get("totalMinionsKilled", 0) + me.get("neutralMinionsKilled", 0)
-        dmg = me.get("totalDamageDealtToChampions", 0)
-        gold = me.get("goldEarned", 0)
-        dur = info.get("gameDuration", 0)
-
-        item_cols = {f"item{i}": me.get(f"item{i}", 0) for i in range(7)}
-
-        rows.append({
-            "matchId": meta["matchId"],
-            "gameDuration": dur,
-            "champion": me.get("championName"),
-            "role": (me.get("teamPosition") or me.get("role") or "").upper(),
-            "win": int(me.get("win", False)),
-
-            #battle, damage, farming
-            "kills": k,
-            "deaths": d,                
-            "assists": a,
-            "kda": (k + a) / max(d, 1),
-            "killParticipation": me.get("challenges", {}).get("killParticipation", 0),                
-            "gold": gold,
-            "goldPerMin": per_min(gold, dur),
-            "cs": cs,
-            "csPerMin": per_min(cs, dur),
-            "dmg": dmg,
-            "dmgPerMin": per_min(dmg, dur),
-            "damageTaken": me.get("totalDamageTaken", 0),
-            "damageMitigated": me.get("damageSelfMitigated", 0),
-
-            #vision, level
-            "visionScore": me.get("visionScore", 0),
-            "wardsPlaced": me.get("wardsPlaced", 0),
-            "wardsKilled": me.get("wardsKilled", 0),
-            "champLevel": me.get("champLevel", 0),
-            "xp": me.get("champExperience", 0),
-            "xpPerMin": per_min(me.get("champExperience", 0), dur),
-
-            #rune, meta
-            "gameVersion": info.get("gameVersion", ""),
-            "queueId": info.get("queueId", 0),
-            "runePrimary": me.get("perks", {}).get("styles", [{}])[0].get("style", None),
-            "runeSub": me.get("perks", {}).get("styles", [{}])[1].get("style", None),
-            **item_cols,
-        })
-    
-    df = pd.DataFrame(rows)
+def featurize(raw: dict, puuid: str) -> dict | None:
+    info = raw["info"]
+    meta = raw["metadata"]
+    dur = info.get("gameDuration", 0)
+    parts = info.get("participants", [])
+
+    #only my data
+    me = next((p for p in parts if p.get("puuid") == puuid), None)        
+    if me is None:
+        return None
+
+    k = me.get("kills", 0)
+    d = me.get("deaths", 0)
+    a = me.get("assists", 0)
+    cs = me.get("totalMinionsKilled", 0) + me.get("neutralMinionsKilled", 0)
+    dmg = me.get("totalDamageDealtToChampions", 0)
+    gold = me.get("goldEarned", 0)
+    dur = info.get("gameDuration", 0)
+
+    item_cols = {f"item{i}": me.get(f"item{i}", 0) for i in range(7)}
+
+    return {
+        "matchId": meta["matchId"],
+        "gameDuration": dur,
+        "champion": me.get("championName"),
+        "role": (me.get("teamPosition") or me.get("role") or "").upper(),
+        "win": int(me.get("win", False)),
+
+        #battle, damage, farming
+        "kills": k,
+        "deaths": d,                
+        "assists": a,
+        "kda": (k + a) / max(d, 1),
+        "killParticipation": me.get("challenges", {}).get("killParticipation", 0),                
+        "gold": gold,
+        "goldPerMin": per_min(gold, dur),
+        "cs": cs,
+        "csPerMin": per_min(cs, dur),
+        "dmg": dmg,
+        "dmgPerMin": per_min(dmg, dur),
+        "damageTaken": me.get("totalDamageTaken", 0),
+        "damageMitigated": me.get("damageSelfMitigated", 0),
+
+        #vision, level
+        "visionScore": me.get("visionScore", 0),
+        "wardsPlaced": me.get("wardsPlaced", 0),
+        "wardsKilled": me.get("wardsKilled", 0),
+        "champLevel": me.get("champLevel", 0),
+        "xp": me.get("champExperience", 0),
+        "xpPerMin": per_min(me.get("champExperience", 0), dur),
+
+        #rune, meta
+        "gameVersion": info.get("gameVersion", ""),
+        "queueId": info.get("queueId", 0),
+        "runePrimary": me.get("perks", {}).get("styles", [{}])[0].get("style", None),
+        "runeSub": me.get("perks", {}).get("styles", [{}])[1].get("style", None),
+        **item_cols,
+    }
+
+# ---- feature table ----
+# bump when a column is added/changed in featurize(), forces one full rebuild
+FEATURE_SCHEMA_VERSION = 1
+OUT_CSV = "data/my_matches_ml.csv"
+META_PATH = "data/my_matches_ml.meta.json"
+
+def load_feature_meta(path=META_PATH):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print("피처 메타 로드 실패, 전체 재생성:", e)
+        return None
+
+def save_feature_meta(match_ids, skipped=(), csv_path=OUT_CSV, path=META_PATH):
+    # match_ids: rows in the CSV, skipped: decoded but no row (puuid not in the match)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"schema": FEATURE_SCHEMA_VERSION, "match_ids": sorted(match_ids),
+                   "skipped": sorted(skipped), "csv": source_signature(csv_path)}, f)
+    os.replace(tmp, path)
+
+def _write_csv(df, out_csv, append=False):
+    # temp copy + os.replace: a crash leaves the old or the new CSV, never a half-written row
+    tmp = out_csv + ".tmp"
+    if append:
+        shutil.copyfile(out_csv, tmp)
+    df.to_csv(tmp, mode="a" if append else "w", header=not append, index=False, encoding="utf-8-sig")
+    os.replace(tmp, out_csv)
+
+def _my_puuid():
+    # imported here: synthetic-data benchmarks run without secret_config.py
+    from secret_config import MY_PUUID
+    return MY_PUUID
+
+def main(full=False, puuid=None):
+    puuid = puuid or _my_puuid()
+    if not (os.path.exists(STORE_PATH) or os.path.exists(LEGACY_JSONL_PATH)):
+        raise FileNotFoundError(f"{STORE_PATH}가 없습니다. 먼저 load_my_matches.py를 실행하세요.")
+
+    meta = load_feature_meta()
+    incremental = not (full or meta is None or meta.get("schema") != FEATURE_SCHEMA_VERSION or not os.path.exists(OUT_CSV))
+    if not incremental:
+        if not full and meta is not None and meta.get("schema") != FEATURE_SCHEMA_VERSION:
+            print(f"피처 스키마 변경 (v{meta.get('schema')} -> v{FEATURE_SCHEMA_VERSION}), 전체 재생성")
+        featurized, skipped = set(), set()
+        stale = False
+    else:
+        featurized, skipped = set(meta.get("match_ids", [])), set(meta.get("skipped", []))
+        stale = meta.get("csv") != source_signature(OUT_CSV)
+        if stale:
+            # CSV changed after the meta was saved (crash in between): its own matchIds are the truth
+            featurized |= set(pd.read_csv(OUT_CSV, usecols=["matchId"], encoding="utf-8-sig")["matchId"].astype(str))
+
+    #---- get data, make DataFrame (only matches not featurized / skipped yet)
+    rows, new_skipped = [], set()
+    for raw in open_matches(puuid, skip=featurized | skipped):
+        row = featurize(raw, puuid)
+        if row is not None:
+            rows.append(row)
+        else:
+            new_skipped.add(raw["metadata"]["matchId"])
+    skipped |= new_skipped
+
     os.makedirs("data", exist_ok=True)
-    out_csv = "data/my_matches_ml.csv"
-    df.to_csv(out_csv, index=False, encoding="utf-8-sig")
+    out_csv = OUT_CSV
+    df = pd.DataFrame(rows)
+    if incremental:
+        if df.empty:
+            if stale: # finish what the interrupted run left: columnar store + summary from the CSV
+                write_features(pd.read_csv(out_csv, encoding="utf-8-sig"), out_csv)
+                write_champ_summary(build_champ_summary(load_features(out_csv)), out_csv)
+            if new_skipped or stale:
+                save_feature_meta(featurized, skipped, out_csv)
+            print(f"새 경기 없음 (기존 {len(featurized)} 경기)")
+            return
+        header = list(pd.read_csv(out_csv, nrows=0, encoding="utf-8-sig").columns)
+        df = df.reindex(columns=header)
+        prev_source = source_signature(out_csv)
+        _write_csv(df, out_csv, append=True)
+        store = append_features(df, out_csv, prev_source)
+        print(f"머신러닝용 CSV 추가 완료 (+{len(df)} 경기, 총 {len(featurized) + len(df)} 경기)")
+    else:
+        if df.empty: # empty store / puuid in no match: no columns to type, keep whatever is on disk
+            print(f"피처를 만들 경기가 없습니다 (매치 {len(skipped)}개 중 내 경기 0개)")
+            return
+        _write_csv(df, out_csv)
+        store = write_features(df, out_csv)
+        print(f"머신러닝용 CSV 생성 완료 ({len(df)} 경기)")
+    save_feature_meta(featurized | set(df["matchId"]), skipped, out_csv)
+    summary_path = write_champ_summary(build_champ_summary(load_features(out_csv)), out_csv)
 
-    print(f"머신러닝용 CSV 생성 완료 ({len(df)} 경기)")
-    print(f"경로: {out_csv}")
+    print(f"경로: {out_csv} (columnar: {store}, 챔피언 요약: {summary_path})")
     print("컬럼 예시:", list(df.columns)[:12])
     print(df.head(3))
 
+def bench_decode(puuid, limit=None):
+    """stdlib json.loads / orjson.loads 전체 파싱과 project_match 속도 비교 (gzip 해제 시간 제외)"""
+    lines = []
+    for line in open_store().iter_raw():
+        lines.append(line)
+        if limit and len(lines) >= limit:
+            break
+    if not lines:
+        print("비교할 매치가 없습니다.")
+        return
+
+    def me_of(raw):
+        return next((p for p in raw["info"]["participants"] if p.get("puuid") == puuid), None)
+
+    cases = [("json.loads", lambda line: me_of(json.loads(line)))]
+    if orjson:
+        cases.append(("orjson.loads", lambda line: me_of(orjson.loads(line))))
+    cases.append(("project_match", lambda line: (project_match(line, puuid)["info"]["participants"] or [None])[0]))
+
+    results = {}
+    for name, fn in cases:
+        t0 = time.perf_counter()
+        out = [fn(line) for line in lines]
+        results[name] = (time.perf_counter() - t0, out)
+
+    base, ref = results["json.loads"]
+    backend = "orjson" if orjson else "json"
+    print(f"매치 {len(lines)}개, 평균 {sum(map(len, lines)) / len(lines) / 1024:.1f} KB/매치, backend={backend}")
+    for name, (sec, out) in results.items():
+        mismatch = sum(a != b for a, b in zip(ref, out))
+        print(f"  - {name:<13}: {sec * 1000:7.1f} ms ({sec / len(lines) * 1e6:.0f} us/매치)"
+              f"  x{base / max(sec, 1e-9):.2f}  (불일치 {mismatch}개)")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--full", action="store_true", help="기존 CSV를 무시하고 전체 재생성")
+    ap.add_argument("--bench-decode", action="store_true", help="디코딩 속도 비교만 실행")
+    ap.add_argument("--limit", type=int, help="비교할 최대 매치 수")
+    args = ap.parse_args()
+    if args.bench_decode:
+        bench_decode(_my_puuid(), args.limit)
+    else:
+        main(full=args.full)
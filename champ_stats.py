@@ -0,0 +1,135 @@
+import os
+import numpy as np
+import pandas as pd
+from feature_store import CSV_PATH, load_features, source_signature
+
+SUMMARY_PATH = "data/my_champ_summary.pkl"
+
+NUM_MEAN_COLS = ["kills", "deaths", "assists", "goldPerMin", "csPerMin", "dmgPerMin", "visionScore", "xpPerMin"]
+# source column -> summary column, with the default used when nothing was played
+MODE_COLS = {
+    "role":        ("role_mode", "ADC"),
+    "runePrimary": ("rune_primary_mode", 8000),
+    "runeSub":     ("rune_sub_mode", 8300),
+    "queueId":     ("queue_mode", 420),
+    "patch":       ("patch_mode", ""),
+}
+
+# ---- per-champion summary ----
+def _group_mode(df: pd.DataFrame, col: str) -> pd.Series:
+    # same pick as Series.mode().iloc[0]: highest count, smallest value on ties
+    counts = df.groupby(["champion", col], observed=True).size().rename("n").reset_index()
+    counts = counts[counts["n"] > 0]
+    counts = counts.sort_values(["champion", "n", col], ascending=[True, False, True], kind="mergesort")
+    return counts.drop_duplicates("champion").set_index("champion")[col]
+
+def _global_mode(series: pd.Series, default):
+    s = series.dropna()
+    return s.mode().iloc[0] if not s.empty else default
+
+def _plain(v):
+    # numpy/categorical scalars -> python types for the GUI / CLI
+    if hasattr(v, "item"):
+        v = v.item()
+    return v
+
+def build_champ_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """챔피언별 판수/승/승률/최빈 룬·포지션·큐·패치/평균 지표를 groupby 한 번으로 계산"""
+    g = df.groupby(df["champion"].astype(str), observed=True)
+    table = pd.DataFrame({"games": g.size(), "wins": g["win"].sum().astype("int64")})
+    table["winrate"] = table["wins"] / table["games"]
+
+    tmp = df.assign(champion=df["champion"].astype(str))
+    for col, (out, default) in MODE_COLS.items():
+        if col in df.columns:
+            table[out] = _group_mode(tmp, col).astype(object).reindex(table.index).fillna(default)
+        else:
+            table[out] = default
+
+    num_cols = [c for c in NUM_MEAN_COLS if c in df.columns]
+    means = tmp[num_cols].astype("float64").groupby(tmp["champion"]).mean()
+    for c in NUM_MEAN_COLS:
+        table[c] = means[c].astype("float64") if c in means.columns else 0.0
+    table.index.name = "champion"
+
+    glob = {out: _plain(_global_mode(df[col], default)) if col in df.columns else default
+            for col, (out, default) in MODE_COLS.items()}
+    for c in NUM_MEAN_COLS:
+        glob[c] = float(df[c].mean()) if c in df.columns and len(df) else 0.0
+    table.attrs["global"] = glob
+    return table
+
+def write_champ_summary(table: pd.DataFrame, csv_path=CSV_PATH, path=SUMMARY_PATH) -> str:
+    table.attrs["source"] = source_signature(csv_path)
+    tmp = path + ".tmp"
+    table.to_pickle(tmp)
+    os.replace(tmp, path)
+    return path
+
+def load_champ_summary(csv_path=CSV_PATH, path=SUMMARY_PATH, df=None) -> pd.DataFrame:
+    """저장된 요약표. CSV 가 바뀌었으면 (stale) 다시 계산해서 저장."""
+    if os.path.exists(path):
+        table = pd.read_pickle(path)
+        if table.attrs.get("source") == source_signature(csv_path):
+            return table
+    table = build_champ_summary(df if df is not None else load_features(csv_path))
+    write_champ_summary(table, csv_path, path)
+    return table
+
+def champion_row(table: pd.DataFrame, champ: str) -> dict | None:
+    if champ not in table.index:
+        return None
+    out = {k: _plain(v) for k, v in table.loc[champ].items()}
+    out["games"] = int(out["games"])
+    out["wins"] = int(out["wins"])
+    return out
+
+# ---- core items ----
+ITEM_COLS = [f"item{i}" for i in range(7)]
+
+def is_core_item(item_info: dict) -> bool:
+    # only core item > 1600 gold
+    if not item_info:
+        return False
+    tags = set(item_info.get("tags", []))
+    name = item_info.get("name", "")
+    gold = (item_info.get("gold") or {}).get("total", 0)
+
+    # exclusive item
+    if "Consumable" in tags: return False
+    if "Trinket"    in tags: return False
+    if "Vision"     in tags: return False
+    if "Boots"      in tags: return False
+    if "Jungle"     in tags: return False
+    if "Support"    in tags: return False
+    if any(k in name for k in ["Elixir", "Potion", "Stealth Ward", "Farsight", "Oracle"]):
+        return False
+
+    return gold >= 1600
+
+def core_item_lookup(meta: dict) -> np.ndarray:
+    """item.json data -> lookup[item_id] == True 이면 코어 아이템"""
+    ids = [int(k) for k, info in meta.items() if str(k).isdigit() and is_core_item(info)]
+    lookup = np.zeros(max(ids) + 1 if ids else 1, dtype=bool)
+    lookup[ids] = True
+    return lookup
+
+def top_core_items_by_champ(df: pd.DataFrame, lookup: np.ndarray, top=3) -> dict:
+    """모든 챔피언의 코어 아이템 빈도를 한 번에 세서 {champion: [item_id, ...]} 반환"""
+    if df.empty or not all(c in df.columns for c in ITEM_COLS):
+        return {}
+    codes, champs = pd.factorize(df["champion"].astype(str))
+    items = df[ITEM_COLS].apply(pd.to_numeric, errors="coerce").fillna(0).to_numpy(dtype=np.int64).ravel()
+    champ = np.repeat(codes, len(ITEM_COLS))
+    pos = np.arange(items.size)  # row-major slot order, breaks ties like Counter.most_common
+
+    ok = (items > 0) & (items < len(lookup))
+    ok[ok] = lookup[items[ok]]
+    long = pd.DataFrame({"champ": champ[ok], "item": items[ok], "pos": pos[ok]})
+    if long.empty:
+        return {}
+
+    agg = long.groupby(["champ", "item"], sort=False).agg(n=("pos", "size"), first=("pos", "min")).reset_index()
+    agg = agg.sort_values(["champ", "n", "first"], ascending=[True, False, True], kind="mergesort")
+    best = agg.groupby("champ", sort=False).head(top)
+    return {champs[c]: [int(it) for it in grp["item"]] for c, grp in best.groupby("champ", sort=False)}
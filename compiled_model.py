@@ -0,0 +1,245 @@
+# compiled_model.py
+import os, sys, json, time
+import numpy as np
+
+# trained Pipeline(ColumnTransformer(OneHotEncoder + passthrough), RandomForestClassifier)
+# -> flat numpy arrays, evaluated without sklearn / pandas validation / joblib dispatch
+ARRAYS = ["feature", "threshold", "children", "missing_left", "proba", "roots"]
+
+def compiled_path_for(model_path: str) -> str:
+    return os.path.splitext(model_path)[0] + ".compiled"
+
+def file_signature(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+def _cat_key(v, numeric: bool):
+    # category -> dict key; numeric columns match 8000 / 8000.0 / "8000" like the encoder does on ints
+    if numeric:
+        try:
+            return float(v)
+        except (TypeError, ValueError):
+            return None
+    return str(v)
+
+class CompiledModel:
+    """RandomForest 파이프라인을 평탄화한 배열 모델. predict_proba(DataFrame) 는 sklearn 과 같은 값."""
+    def __init__(self, meta: dict, arrays: dict):
+        self.meta = meta
+        self.classes_ = np.asarray(meta["classes"])
+        self.cat_cols = [c["name"] for c in meta["cat_cols"]]
+        self.num_cols = meta["num_cols"]
+        self.num_offset = meta["num_offset"]
+        self.n_features = meta["n_features"]
+        self.max_depth = meta["max_depth"]
+        self._lookup = []
+        for c in meta["cat_cols"]:
+            numeric = c["numeric"]
+            self._lookup.append((c["name"], numeric,
+                                 {_cat_key(v, numeric): c["offset"] + i for i, v in enumerate(c["categories"])}))
+        for name in ARRAYS:
+            setattr(self, name, arrays[name])
+
+    # ---- compile ----
+    @classmethod
+    def from_pipeline(cls, pipe, source=None):
+        prep = pipe.named_steps["prep"]
+        clf = pipe.named_steps["clf"]
+        if prep.output_indices_.get("remainder", slice(0, 0)).stop:
+            raise ValueError("remainder 컬럼은 지원하지 않습니다.")
+
+        cat_cols, num_cols, num_offset = [], [], None
+        for name, trans, cols in prep.transformers_:
+            if name == "remainder":
+                continue
+            start = prep.output_indices_[name].start
+            if name == "cat":
+                if trans.drop_idx_ is not None or getattr(trans, "infrequent_categories_", None):
+                    raise ValueError("drop / infrequent 카테고리는 지원하지 않습니다.")
+                off = start
+                for col, cats in zip(cols, trans.categories_):
+                    numeric = cats.dtype.kind in "iuf"
+                    cat_cols.append({"name": col, "numeric": numeric, "offset": off,
+                                     "categories": [v.item() if hasattr(v, "item") else v for v in cats]})
+                    off += len(cats)
+            elif name == "num":
+                num_cols, num_offset = list(cols), start
+            else:
+                raise ValueError(f"지원하지 않는 변환기: {name}")
+
+        # all trees in one node table, child indices shifted by each tree's offset
+        feats, thrs, children, missing, probas, roots = [], [], [], [], [], []
+        off, depth = 0, 0
+        for est in clf.estimators_:
+            t = est.tree_
+            leaf = t.children_left == -1
+            feats.append(np.where(leaf, 0, t.feature).astype(np.int32))
+            thrs.append(t.threshold.astype(np.float64))
+            # leaves point at themselves: fixed-depth traversal needs no branch on "is leaf"
+            idx = np.arange(t.node_count, dtype=np.int64) + off
+            left = np.where(leaf, idx, t.children_left + off)
+            right = np.where(leaf, idx, t.children_right + off)
+            children.append(np.stack([left, right], axis=1).ravel()) # [2*node] left, [2*node + 1] right
+            # NaN goes where sklearn sends it (learned per split, or the bigger child if no NaN was seen)
+            miss = getattr(t, "missing_go_to_left", None)
+            missing.append(np.ones(t.node_count, dtype=bool) if miss is None else miss.astype(bool))
+            v = t.value[:, 0, :].astype(np.float64)
+            probas.append(v / v.sum(axis=1, keepdims=True)) # counts (old sklearn) or fractions -> probabilities
+            roots.append(off)
+            off += t.node_count
+            depth = max(depth, t.max_depth)
+
+        arrays = {
+            "feature": np.concatenate(feats),
+            "threshold": np.concatenate(thrs),
+            "children": np.concatenate(children).astype(np.int32),
+            "missing_left": np.concatenate(missing),
+            "proba": np.ascontiguousarray(np.concatenate(probas).T), # (classes, nodes)
+            "roots": np.asarray(roots, dtype=np.int32),
+        }
+        meta = {
+            "format": 2,
+            "classes": [c.item() if hasattr(c, "item") else c for c in clf.classes_],
+            "cat_cols": cat_cols,
+            "num_cols": num_cols,
+            "num_offset": num_offset,
+            "n_features": int(clf.n_features_in_),
+            "n_trees": len(roots),
+            "max_depth": int(depth),
+            "source": source,
+        }
+        return cls(meta, arrays)
+
+    # ---- save / load ----
+    def save(self, path: str):
+        """디렉터리에 배열별 .npy (비압축) + meta.json"""
+        os.makedirs(path, exist_ok=True)
+        for name in ARRAYS:
+            tmp = os.path.join(path, name + ".tmp.npy")
+            np.save(tmp, getattr(self, name))
+            os.replace(tmp, os.path.join(path, name + ".npy"))
+        tmp = os.path.join(path, "meta.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, ensure_ascii=False)
+        os.replace(tmp, os.path.join(path, "meta.json")) # written last: marks a complete model
+        return path
+
+    @classmethod
+    def load(cls, path: str, mmap_mode="r"):
+        """mmap_mode="r": 배열을 읽지 않고 매핑만 함 -> 로드 시간 일정, 여러 프로세스가 page cache 공유"""
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {name: np.load(os.path.join(path, name + ".npy"), mmap_mode=mmap_mode) for name in ARRAYS}
+        return cls(meta, arrays)
+
+    # ---- inference ----
+    def transform(self, X) -> np.ndarray:
+        """DataFrame -> 원-핫 + 수치 피처 행렬 (float32, 트리가 보는 값과 동일)"""
+        n = len(X)
+        out = np.zeros((n, self.n_features), dtype=np.float32)
+        rows = np.arange(n)
+        for name, numeric, lookup in self._lookup:
+            idx = np.fromiter((lookup.get(_cat_key(v, numeric), -1) for v in X[name]), dtype=np.int64, count=n)
+            hit = idx >= 0 # unknown category -> all zeros (handle_unknown="ignore")
+            out[rows[hit], idx[hit]] = 1.0
+        if self.num_cols:
+            out[:, self.num_offset:self.num_offset + len(self.num_cols)] = \
+                np.asarray(X[self.num_cols], dtype=np.float64).astype(np.float32)
+        return out
+
+    def _leaves(self, Xt: np.ndarray) -> np.ndarray:
+        # all trees at once, one level per step: (trees, rows) node ids
+        n, f = Xt.shape
+        flat = Xt.ravel()
+        base = np.arange(n, dtype=np.int64) * f
+        node = np.repeat(self.roots[:, None], n, axis=1).astype(np.int64)
+        for _ in range(self.max_depth):
+            # sklearn goes left on X[f] <= threshold (float32 X vs float64 threshold), NaN by missing_left
+            x = flat.take(base + self.feature.take(node))
+            right = np.where(np.isnan(x), ~self.missing_left.take(node), x > self.threshold.take(node))
+            node = self.children.take(2 * node + right)
+        return node
+
+    def predict_proba(self, X, block=128) -> np.ndarray:
+        Xt = self.transform(X)
+        n_trees = len(self.roots)
+        out = np.empty((len(Xt), len(self.classes_)))
+        for i in range(0, len(Xt), block): # small blocks keep the (trees x rows) gathers in cache
+            leaves = self._leaves(Xt[i:i + block])
+            for c in range(len(self.classes_)):
+                # tree by tree summation, then divide: same order as RandomForestClassifier
+                out[i:i + block, c] = self.proba[c].take(leaves).sum(axis=0) / n_trees
+        return out
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+def compile_model(pipe, model_path: str, out_path=None) -> str:
+    out_path = out_path or compiled_path_for(model_path)
+    return CompiledModel.from_pipeline(pipe, source=file_signature(model_path)).save(out_path)
+
+def load_compiled(model_path: str, mmap_mode="r"):
+    """joblib 모델과 같은 버전의 컴파일 모델이 있으면 로드, 없으면 None"""
+    path = compiled_path_for(model_path)
+    try:
+        m = CompiledModel.load(path, mmap_mode)
+    except (OSError, ValueError, KeyError):
+        return None
+    sig = file_signature(model_path)
+    if sig is not None and m.meta.get("source") != sig:
+        return None # model retrained since it was compiled
+    return m
+
+# ---- load benchmark probe (run in a fresh process by analyze_my_winrate.py --bench-load) ----
+def _rss_kb() -> dict:
+    # Linux: anonymous (private) vs file-backed (shareable page cache) resident memory
+    out = {}
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                key, _, val = line.partition(":")
+                if key in ("VmRSS", "RssAnon", "RssFile"):
+                    out[key] = int(val.split()[0])
+    except OSError:
+        import resource
+        out["VmRSS"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return out
+
+def load_probe(kind: str, model_path: str):
+    """kind = joblib | compiled | mmap. import / load 시간과 로드 후 RSS 증가분을 JSON 으로 출력"""
+    t0 = time.perf_counter()
+    if kind == "joblib":
+        import joblib, sklearn.ensemble, sklearn.compose # what unpickling needs anyway
+    t1 = time.perf_counter()
+    before = _rss_kb()
+
+    if kind == "joblib":
+        model = joblib.load(model_path)
+        n_features = model.named_steps["clf"].n_features_in_
+    else:
+        model = CompiledModel.load(compiled_path_for(model_path), mmap_mode="r" if kind == "mmap" else None)
+        n_features = model.n_features
+    t2 = time.perf_counter()
+    after = _rss_kb()
+
+    # one traversal: touches only the pages on a root-to-leaf path of each tree
+    if kind != "joblib":
+        model._leaves(np.zeros((1, n_features), dtype=np.float32))
+    touched = _rss_kb()
+
+    delta = lambda a, k: a.get(k, 0) - before.get(k, 0)
+    print(json.dumps({
+        "kind": kind,
+        "import_ms": (t1 - t0) * 1000,
+        "load_ms": (t2 - t1) * 1000,
+        "rss_kb": delta(after, "VmRSS"),
+        "anon_kb": delta(after, "RssAnon"),
+        "file_kb": delta(after, "RssFile"),
+        "rss_after_predict_kb": delta(touched, "VmRSS"),
+    }))
+
+if __name__ == "__main__" and len(sys.argv) == 4 and sys.argv[1] == "--probe":
+    load_probe(sys.argv[2], sys.argv[3])
@@ -0,0 +1,114 @@
+import os, json, time, threading
+
+# ---- Riot Data Dragon disk cache ----
+# cdn/<version>/... never changes once published -> stored forever, no revalidation.
+# api/versions.json does change -> TTL, then ETag revalidation (If-None-Match).
+CDN_URL = "https://ddragon.leagueoflegends.com"
+VERSION_URL = f"{CDN_URL}/api/versions.json"
+CACHE_DIR = "data/ddragon"
+VERSIONS_TTL = 6 * 3600
+FALLBACK_VERSION = "14.10.1"
+
+_session = None
+
+def session():
+    # requests is imported on first use: a warm cache never needs it (GUI start-up)
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+    return _session
+
+def cache_path(rel: str) -> str:
+    return os.path.join(CACHE_DIR, *rel.split("/"))
+
+def _write_atomic(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def _read(path: str):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+def get_versions(ttl=VERSIONS_TTL, timeout=10) -> list:
+    path = cache_path("api/versions.json")
+    meta_path = path + ".meta"
+    cached = _read(path)
+    meta = json.loads(_read(meta_path) or b"{}")
+
+    if cached is not None and time.time() - meta.get("checked", 0) < ttl:
+        return json.loads(cached)
+
+    headers = {"If-None-Match": meta["etag"]} if cached is not None and meta.get("etag") else {}
+    try:
+        r = session().get(VERSION_URL, headers=headers, timeout=timeout)
+        if r.status_code == 304:
+            pass
+        else:
+            r.raise_for_status()
+            cached = r.content
+            _write_atomic(path, cached)
+            meta["etag"] = r.headers.get("ETag")
+        meta["checked"] = time.time()
+        _write_atomic(meta_path, json.dumps(meta).encode())
+    except Exception as e:
+        if cached is None:
+            raise
+        print("버전 조회 실패, 캐시 사용:", e) # offline
+    return json.loads(cached)
+
+def last_version() -> str:
+    try:
+        return get_versions()[0]
+    except Exception as e:
+        print("버전 조회 실패", e)
+        return FALLBACK_VERSION
+
+def cached_last_version() -> str:
+    """네트워크 없이 캐시된 최신 버전 (TTL 무시). 캐시가 없을 때만 조회."""
+    cached = _read(cache_path("api/versions.json"))
+    if cached is not None:
+        try:
+            return json.loads(cached)[0]
+        except (ValueError, IndexError):
+            pass
+    return last_version()
+
+def revalidate_versions_async():
+    # refresh versions.json in the background; a new patch is picked up on the next start
+    t = threading.Thread(target=last_version, daemon=True, name="ddragon-versions")
+    t.start()
+    return t
+
+def get_url(url: str, timeout=10) -> bytes | None:
+    """Data Dragon CDN 파일을 디스크 캐시 경유로 가져온다. 실패하면 None."""
+    if not url.startswith(CDN_URL + "/"):
+        r = session().get(url, timeout=timeout)
+        r.raise_for_status()
+        return r.content
+    path = cache_path(url[len(CDN_URL) + 1:])
+    data = _read(path)
+    if data is not None:
+        return data
+    try:
+        r = session().get(url, timeout=timeout)
+        r.raise_for_status()
+    except Exception as e:
+        print("Data Dragon 요청 실패:", url, e)
+        return None
+    _write_atomic(path, r.content)
+    return r.content
+
+def get_json(version: str, rel: str):
+    # e.g. get_json("15.3.1", "data/en_US/champion.json")
+    data = get_url(f"{CDN_URL}/cdn/{version}/{rel}")
+    return json.loads(data) if data is not None else None
+
+def asset_url(version: str, rel: str) -> str:
+    return f"{CDN_URL}/cdn/{version}/{rel}"
@@ -0,0 +1,100 @@
+import os
+import pandas as pd
+
+CSV_PATH = "data/my_matches_ml.csv"
+
+# string / id columns stored as pandas categoricals
+CATEGORY_COLS = ["champion", "role", "patch", "gameVersion", "runePrimary", "runeSub"]
+
+# ---- utility ----
+def normalize_role(s: str) -> str:
+    s = (s or "").upper()
+    if s in ("BOTTOM", "BOT"):
+        return "ADC"
+    if s in ("UTILITY",):
+        return "SUPPORT"
+    if s == "MIDDLE":
+        return "MID"
+    return s or "UNKNOWN"
+
+def to_patch(ver: str) -> str:
+    # "14.20.123" -> "14.20"
+    if not isinstance(ver, str) or "." not in ver:
+        return ""
+    p = ver.split(".")
+    return f"{p[0]}.{p[1]}" if len(p) >= 2 else ver
+
+def store_path_for(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".pkl"
+
+# ---- columnar frame ----
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df["role"] = df["role"].fillna("").astype(str).map(normalize_role)
+    if "gameVersion" in df.columns:
+        df["patch"] = df["gameVersion"].fillna("").astype(str).map(to_patch)
+    else:
+        df["patch"] = ""
+    return df
+
+def _typed(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    for c in df.columns:
+        if c in CATEGORY_COLS or c == "matchId":
+            continue
+        if pd.api.types.is_numeric_dtype(df[c]) or pd.api.types.is_bool_dtype(df[c]):
+            s = pd.to_numeric(df[c], errors="coerce").fillna(0)
+            if (s % 1 == 0).all():
+                df[c] = pd.to_numeric(s.astype("int64"), downcast="integer")
+            else:
+                df[c] = pd.to_numeric(s, downcast="float")
+    for c in CATEGORY_COLS:
+        if c not in df.columns:
+            continue
+        if c in ("runePrimary", "runeSub"):
+            df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0).astype("int64").astype("category")
+        else:
+            df[c] = df[c].astype(object).where(df[c].notna(), "").astype(str).astype("category")
+    return df
+
+def to_columnar(df: pd.DataFrame) -> pd.DataFrame:
+    """CSV 프레임 -> role/patch 정규화 + categorical/downcast 된 프레임"""
+    return _typed(_normalize(df))
+
+def source_signature(csv_path=CSV_PATH):
+    if not os.path.exists(csv_path):
+        return None
+    st = os.stat(csv_path)
+    return [st.st_size, st.st_mtime_ns]
+
+def _save(df: pd.DataFrame, path, csv_path):
+    df.attrs["source"] = source_signature(csv_path)
+    tmp = path + ".tmp"
+    df.to_pickle(tmp)
+    os.replace(tmp, path)
+    return path
+
+def write_features(df: pd.DataFrame, csv_path=CSV_PATH) -> str:
+    return _save(to_columnar(df), store_path_for(csv_path), csv_path)
+
+def append_features(new_df: pd.DataFrame, csv_path=CSV_PATH, prev_source=None) -> str:
+    """CSV 에 new_df 를 덧붙인 직후 호출. 저장본이 덧붙이기 전 CSV 와 일치할 때만 이어 붙인다."""
+    path = store_path_for(csv_path)
+    old = pd.read_pickle(path) if os.path.exists(path) else None
+    if old is None or prev_source is None or old.attrs.get("source") != prev_source:
+        return write_features(pd.read_csv(csv_path, encoding="utf-8-sig"), csv_path)
+    # concat mixes category sets, so the result is typed again
+    old = old.astype({c: object for c in CATEGORY_COLS if c in old.columns})
+    df = pd.concat([old, _normalize(new_df)], ignore_index=True)
+    return _save(_typed(df), path, csv_path)
+
+def load_features(csv_path=CSV_PATH) -> pd.DataFrame:
+    """columnar 저장본이 지금 CSV 에서 만들어진 것이면 그대로, 아니면 CSV 에서 변환"""
+    path = store_path_for(csv_path)
+    if os.path.exists(path):
+        df = pd.read_pickle(path)
+        if df.attrs.get("source") == source_signature(csv_path) or not os.path.exists(csv_path):
+            return df
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"{csv_path} 가 없습니다. 먼저 build_my_stats.py를 실행하세요.")
+    return to_columnar(pd.read_csv(csv_path, encoding="utf-8-sig"))
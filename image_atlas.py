@@ -0,0 +1,94 @@
+import os, json, math
+from PIL import Image
+
+ATLAS_DIR = "images/atlas"
+
+# sizes the GUI actually draws: grid buttons / detail portrait, rune row, core item cells
+CHAMP_SIZES = [(100, 100), (180, 180)]
+RUNE_SIZES = [(28, 28)]
+ITEM_SIZES = [(48, 48)]
+
+def atlas_name(group: str, size) -> str:
+    # e.g. "champions_100x100", "items_15.3.1_48x48"
+    return f"{group}_{size[0]}x{size[1]}"
+
+def _paths(name: str, atlas_dir=ATLAS_DIR):
+    base = os.path.join(atlas_dir, name)
+    return base + ".png", base + ".json"
+
+def _sig(path: str):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+# ---- build (offline, mkimg.py) ----
+def build_atlas(name: str, sources: dict, size, atlas_dir=ATLAS_DIR):
+    """{key: 원본 png 경로} -> 미리 리사이즈한 타일을 한 장의 PNG로 묶고 인덱스(json) 저장"""
+    w, h = size
+    tiles = {}
+    for key, path in sources.items():
+        try:
+            img = Image.open(path).convert("RGBA")
+        except Exception as e:
+            print(f"아틀라스 원본 로드 실패 ({path}):", e)
+            continue
+        if img.size != (w, h):
+            img = img.resize((w, h), Image.LANCZOS)
+        tiles[str(key)] = (img, _sig(path))
+    if not tiles:
+        return None
+
+    cols = math.ceil(math.sqrt(len(tiles)))
+    rows = math.ceil(len(tiles) / cols)
+    sheet = Image.new("RGBA", (cols * w, rows * h), (0, 0, 0, 0))
+    index = {}
+    for i, key in enumerate(sorted(tiles)):
+        img, sig = tiles[key]
+        x, y = (i % cols) * w, (i // cols) * h
+        sheet.paste(img, (x, y))
+        index[key] = {"xy": [x, y], "src": sources[key], "sig": sig}
+
+    os.makedirs(atlas_dir, exist_ok=True)
+    png_path, idx_path = _paths(name, atlas_dir)
+    # png first, index last: an index always points at a finished sheet
+    tmp = png_path + ".tmp"
+    sheet.save(tmp, format="PNG")
+    os.replace(tmp, png_path)
+    tmp = idx_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"size": [w, h], "tiles": index}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, idx_path)
+    return png_path
+
+# ---- load (GUI) ----
+class Atlas:
+    """아틀라스 한 장. get(key)는 디코딩/리사이즈 없이 잘라낸 타일을 돌려준다 (원본이 바뀌었으면 None)."""
+    def __init__(self, sheet: Image.Image, size, tiles: dict):
+        self.sheet = sheet
+        self.size = tuple(size)
+        self.tiles = tiles
+
+    def __contains__(self, key):
+        return str(key) in self.tiles
+
+    def get(self, key):
+        t = self.tiles.get(str(key))
+        if t is None:
+            return None
+        try:
+            if _sig(t["src"]) != t["sig"]:
+                return None # source re-downloaded after the atlas was built -> caller resizes
+        except OSError:
+            pass # source deleted, the tile is still fine
+        x, y = t["xy"]
+        w, h = self.size
+        return self.sheet.crop((x, y, x + w, y + h))
+
+def load_atlas(name: str, atlas_dir=ATLAS_DIR):
+    png_path, idx_path = _paths(name, atlas_dir)
+    try:
+        with open(idx_path, encoding="utf-8") as f:
+            idx = json.load(f)
+        sheet = Image.open(png_path).convert("RGBA")
+    except (OSError, ValueError):
+        return None
+    return Atlas(sheet, idx["size"], idx["tiles"])
@@ -0,0 +1,68 @@
+import threading
+from collections import OrderedDict
+
+def pil_nbytes(img, copies=2) -> int:
+    # decoded RGBA bytes; CTkImage keeps a light + dark copy (same PIL) and a scaled PhotoImage
+    w, h = img.size
+    return w * h * len(img.getbands()) * copies
+
+class ImageCache:
+    """(asset, size) -> 디코딩된 이미지. 바이트 예산을 넘으면 가장 오래 안 쓴 것부터 버림 (LRU)."""
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict() # key -> (value, cost)
+        self._lock = threading.Lock() # shared by the Tk thread and click workers
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def get(self, key):
+        with self._lock:
+            hit = self._items.get(key)
+            if hit is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return hit[0]
+
+    def put(self, key, value, cost: int):
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            if cost > self.max_bytes:
+                return value # never cached, would evict everything
+            self._items[key] = (value, cost)
+            self.nbytes += cost
+            while self.nbytes > self.max_bytes:
+                _, (_, c) = self._items.popitem(last=False)
+                self.nbytes -= c
+                self.evictions += 1
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._items),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
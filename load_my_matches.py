@@ -1,20 +1,155 @@
-import os, time, json
+import os, time, json, argparse, threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
-from urllib.parse import quote
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from match_store import STORE_PATH, open_store
 
-#API key and name 
-from secret_config import RIOT_API_KEY, MY_PUUID
+#API key and name (secret_config.py, or RIOT_API_KEY / MY_PUUID environment variables)
+def _secret(name):
+    if os.environ.get(name):
+        return os.environ[name]
+    import secret_config
+    return getattr(secret_config, name)
 
-HEADERS = {"X-Riot-Token": RIOT_API_KEY}
 REGION_CLUSTER = "asia"
+# RIOT_API_BASE=http://127.0.0.1:8767 -> local mock_riot_server.py
+API_BASE = os.environ.get("RIOT_API_BASE", f"https://{REGION_CLUSTER}.api.riotgames.com")
 
 #QUEUE filter | solo rank = 420
 QUEUE_ID = 420
 
+# dev key limits, replaced by X-App-Rate-Limit / X-Method-Rate-Limit on first response
+DEFAULT_APP_LIMITS = "20:1,100:120"
+DEFAULT_METHOD_LIMITS = "2000:10"
+
+# ---- rate limit ----
+def parse_rate_limits(header: str):
+    # "20:1,100:120" -> [(20, 1.0), (100, 120.0)]
+    limits = []
+    for part in (header or "").split(","):
+        if ":" not in part:
+            continue
+        count, window = part.split(":", 1)
+        try:
+            limits.append((int(count), float(window)))
+        except ValueError:
+            continue
+    return limits
+
+class _Bucket:
+    # one bucket per window, a token comes back `window` seconds after it was spent
+    def __init__(self, limits):
+        self.windows = {}
+        self.blocked_until = 0.0
+        self.set_limits(limits)
+
+    def set_limits(self, limits):
+        old = self.windows
+        self.windows = {w: (n, old[w][1] if w in old else deque()) for n, w in limits}
+
+    def wait_time(self, now):
+        wait = self.blocked_until - now
+        for window, (count, spent) in self.windows.items():
+            while spent and spent[0] <= now - window:
+                spent.popleft()
+            if len(spent) >= count:
+                wait = max(wait, spent[len(spent) - count] + window - now)
+        return wait
+
+    def spend(self, now):
+        for _, spent in self.windows.values():
+            spent.append(now)
+
+    def sync_counts(self, header, now):
+        # server-side count can be ahead of ours (other processes, earlier runs)
+        for count, window in parse_rate_limits(header):
+            if window in self.windows:
+                spent = self.windows[window][1]
+                while len(spent) < count:
+                    spent.append(now)
+
+class RateLimiter:
+    """Riot app/method 레이트 리밋을 함께 지키는 토큰 버킷. 스레드 간 공유."""
+    def __init__(self, app_limits=DEFAULT_APP_LIMITS, method_limits=DEFAULT_METHOD_LIMITS):
+        self._lock = threading.Lock()
+        self._app = _Bucket(parse_rate_limits(app_limits))
+        self._method_default = parse_rate_limits(method_limits)
+        self._methods = {}
+
+    def _method(self, method):
+        if method not in self._methods:
+            self._methods[method] = _Bucket(self._method_default)
+        return self._methods[method]
+
+    def acquire(self, method):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                bucket = self._method(method)
+                wait = max(self._app.wait_time(now), bucket.wait_time(now))
+                if wait <= 0:
+                    self._app.spend(now)
+                    bucket.spend(now)
+                    return
+            time.sleep(min(wait, 1.0))
+
+    def update(self, method, headers):
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._method(method)
+            if headers.get("X-App-Rate-Limit"):
+                self._app.set_limits(parse_rate_limits(headers["X-App-Rate-Limit"]))
+                self._app.sync_counts(headers.get("X-App-Rate-Limit-Count"), now)
+            if headers.get("X-Method-Rate-Limit"):
+                bucket.set_limits(parse_rate_limits(headers["X-Method-Rate-Limit"]))
+                bucket.sync_counts(headers.get("X-Method-Rate-Limit-Count"), now)
+
+    def backoff(self, method, headers, attempt=0):
+        # 429: Retry-After if present, short exponential wait for service limits
+        try:
+            wait = float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            wait = min(2 ** attempt, 30)
+        limit_type = (headers.get("X-Rate-Limit-Type") or "").lower()
+        with self._lock:
+            until = time.monotonic() + wait
+            target = self._method(method) if limit_type == "method" else self._app
+            target.blocked_until = max(target.blocked_until, until)
+        return wait
+
+LIMITER = RateLimiter()
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
+def riot_get(url, method, params=None, retry=5):
+    if "X-Riot-Token" not in SESSION.headers:
+        SESSION.headers["X-Riot-Token"] = _secret("RIOT_API_KEY")
+    for i in range(retry):
+        LIMITER.acquire(method)
+        try:
+            r = SESSION.get(url, params=params, timeout=10)
+        except requests.RequestException as e:
+            print(f"요청 실패 ({e}) → 재시도...")
+            time.sleep(min(2 ** i, 10))
+            continue
+        LIMITER.update(method, r.headers)
+        if r.status_code == 429:
+            wait = LIMITER.backoff(method, r.headers, i)
+            print(f"429 Too Many Requests → {wait:.0f}s 대기 후 재시도...")
+            continue
+        if r.status_code >= 500:
+            time.sleep(min(2 ** i, 10))
+            continue
+        return r
+    return None
+
 # ---- get match data ----
-def list_match_ids(puuid: str, total=300, start_time=None, queue=None):
-    url = f"https://{REGION_CLUSTER}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
+def list_match_ids(puuid: str, total=300, start_time=None, queue=None, known=None):
+    # newest first; with `known`, paging stops at the first already stored ID
+    url = f"{API_BASE}/lol/match/v5/matches/by-puuid/{puuid}/ids"
     got, start = [], 0
     while len(got) < total:
         remain = total - len(got)
@@ -23,55 +158,160 @@ def list_match_ids(puuid: str, total=300, start_time=None, queue=None):
         if start_time: params["startTime"] = int(start_time)
         if queue: params["queue"] = int(queue)
 
-        r = requests.get(url, headers=HEADERS, params=params, timeout=10)
+        r = riot_get(url, "match-ids", params=params)
+        if r is None:
+            raise RuntimeError("매치 ID 목록 조회 실패")
         r.raise_for_status()
 
         batch = r.json()
         if not batch:
             break
+        if known:
+            hit = next((i for i, mid in enumerate(batch) if mid in known), None)
+            if hit is not None:
+                got.extend(batch[:hit])
+                break
         got.extend(batch)
         start += len(batch)
         if len(batch) < count:
             break
-        time.sleep(0.5)
     return got
 
-def get_match_detail(mid, retry=3):
-    url = f"https://{REGION_CLUSTER}.api.riotgames.com/lol/match/v5/matches/{mid}"
-    for i in range(retry):
-        r = requests.get(url, headers=HEADERS, timeout=10)
-        if r.status_code == 200:
-            return r.json()
-        elif r.status_code == 429:
-            wait = 60 * (i + 1)   # 1분 → 2분 → 3분 점진 대기
-            print(f"429 Too Many Requests → {wait}s 대기 후 재시도...")
-            time.sleep(wait)
-        else:
-            print(f"skip {mid} ({r.status_code})")
-            return None
-    return None
-def main():
-    # 2025-01-08 00:00 UTC, season 15 start
-    season_start = 1736294400  
+class ApiKeyError(RuntimeError):
+    """401/403: 키 문제라 매치마다 재시도해도 소용없음 -> 수집 중단"""
 
-    match_ids = list_match_ids(MY_PUUID, total=1000, start_time=season_start, queue=QUEUE_ID)
-    os.makedirs("data", exist_ok=True)
+def get_match_detail(mid, retry=3):
+    """match dict / None (429·5xx·네트워크, 다음에 재시도) / int 상태 코드 (404 등 영구 실패)"""
+    url = f"{API_BASE}/lol/match/v5/matches/{mid}"
+    r = riot_get(url, "match", retry=retry + 2)
+    if r is None:
+        return None
+    if r.status_code in (401, 403):
+        raise ApiKeyError(f"API 키 오류 ({r.status_code}): secret_config.py / RIOT_API_KEY 확인")
+    if r.status_code != 200:
+        print(f"skip {mid} ({r.status_code})")
+        return r.status_code
+    return r.json()
 
-    saved = 0
-    out_path = "data/my_matches_raw.jsonl"
-    with open(out_path, "w", encoding="utf-8") as f:
-        for mid in tqdm(match_ids, desc="load matches"):
+def fetch_match_details(match_ids, workers=8):
+    # yields (mid, result of get_match_detail) in completion order, the limiter keeps all workers under the key's ceiling
+    if workers <= 1:
+        for mid in match_ids:
             try:
                 m = get_match_detail(mid)
-                if MY_PUUID in m.get("metadata", {}).get("participants", []):
-                    f.write(json.dumps(m, ensure_ascii=False) + "\n")
-                    saved += 1
-
-                    time.sleep(0.5)
-            except Exception as e:
+            except ApiKeyError:
+                raise
+            except Exception as e: # same as the threaded path: skip this match, keep syncing
                 print("skip", mid, e)
+                m = None
+            yield mid, m
+        return
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {ex.submit(get_match_detail, mid): mid for mid in match_ids}
+        try:
+            for fut in as_completed(futures):
+                mid = futures[fut]
+                try:
+                    yield mid, fut.result()
+                except ApiKeyError:
+                    raise
+                except Exception as e:
+                    print("skip", mid, e)
+                    yield mid, None
+        finally:
+            for fut in futures:
+                fut.cancel()
+
+# ---- incremental sync ----
+RAW_PATH = STORE_PATH
+SYNC_STATE_PATH = "data/my_matches_sync.json"
+
+def load_sync_state(path=SYNC_STATE_PATH):
+    # pending: retry next run (429 / 5xx / network), failed: {matchId: status} never retried (404 ...)
+    if not os.path.exists(path):
+        return {"pending": []}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print("동기화 상태 로드 실패, 새로 시작:", e)
+        return {"pending": []}
+
+def save_sync_state(state, path=SYNC_STATE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+def sync_matches(puuid, out_path=RAW_PATH, state_path=SYNC_STATE_PATH,
+                 total=1000, start_time=None, queue=None, workers=8, full=False, checkpoint=20,
+                 retry_failed=False):
+    store = open_store(out_path)
+    known = store.ids()
+    state = load_sync_state(state_path)
+    failed = {} if retry_failed else state.get("failed", {})
+    state["failed"] = failed
+
+    new_ids = list_match_ids(puuid, total=total, start_time=start_time, queue=queue,
+                             known=None if full else known)
+    # pending = interrupted or failed fetches of earlier runs
+    todo = list(dict.fromkeys(new_ids + state.get("pending", [])))
+    todo = [mid for mid in todo if mid not in known and mid not in failed]
+    state["pending"] = todo
+    save_sync_state(state, state_path)
+
+    if not todo:
+        print(f"새 매치 없음 (저장된 매치 {len(known)}개)")
+        return 0
+
+    saved, gone = 0, 0
+    pending = set(todo)
+    try:
+        with store:
+            for n, (mid, m) in enumerate(tqdm(fetch_match_details(todo, workers=workers), total=len(todo), desc="load matches"), 1):
+                if isinstance(m, int): # permanent 4xx: out of pending, never asked again
+                    pending.discard(mid)
+                    failed[mid] = m
+                    gone += 1
+                elif m is not None:
+                    pending.discard(mid)
+                    if puuid in m.get("metadata", {}).get("participants", []):
+                        saved += store.append(m)
+                if n % checkpoint == 0:
+                    store.sync()
+                    state["pending"] = [x for x in todo if x in pending]
+                    save_sync_state(state, state_path)
+            store.sync()
+    finally:
+        state["pending"] = [x for x in todo if x in pending]
+        save_sync_state(state, state_path)
+
+    state["last_sync"] = int(time.time())
+    save_sync_state(state, state_path)
+    if gone:
+        print(f"영구 실패 {gone}개 (404 등)는 제외했습니다 (--retry-failed로 다시 시도).")
+    if state["pending"]:
+        print(f"실패 {len(state['pending'])}개는 다음 실행 때 다시 시도합니다.")
+    return saved
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, default=8, help="동시 요청 수 (1 = 순차)")
+    ap.add_argument("--full", action="store_true", help="저장된 ID에서 멈추지 않고 시즌 전체 목록 확인")
+    ap.add_argument("--retry-failed", action="store_true", help="404 등으로 제외한 매치도 다시 요청")
+    ap.add_argument("--api-base", help="API 주소 (예: http://127.0.0.1:8767 = mock_riot_server.py)")
+    args = ap.parse_args()
+    if args.api_base:
+        global API_BASE
+        API_BASE = args.api_base.rstrip("/")
+
+    # 2025-01-08 00:00 UTC, season 15 start
+    season_start = 1736294400
 
-    print(f"저장 완료: {saved}개의 매치 -> {out_path}")
+    saved = sync_matches(_secret("MY_PUUID"), total=1000, start_time=season_start, queue=QUEUE_ID,
+                         workers=args.workers, full=args.full, retry_failed=args.retry_failed)
+    print(f"저장 완료: 새 매치 {saved}개 -> {RAW_PATH}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
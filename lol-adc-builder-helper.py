@@ -1,9 +1,19 @@
-import os, io
-import joblib
-import requests
-import pandas as pd
+import time
+T_START = time.perf_counter() # startup report counts imports too
+import os, io, sys, json, queue, threading
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 import customtkinter as ctk
+import ddragon
+import image_atlas
+import predict_server
+from image_cache import ImageCache, pil_nbytes
+# pandas / joblib / sklearn (feature_store, champ_stats, the model) are imported on
+# first use by the click worker, or by prewarm() once the grid is up
+T_IMPORTS = time.perf_counter()
+
+# startup_bench.py runs the GUI with this flag and reads the [startup] line
+EXIT_AFTER_STARTUP = "--exit-after-startup" in sys.argv
 
 # name ALIAS
 ITEM_ALIAS = {
@@ -56,28 +66,69 @@ CHAMP_ALIAS = {
 }
 
 # ---- utility ----
-def fetch_json(url: str, timeout=10): # JSON request
+def fetch_json(url: str, timeout=10): # JSON request (Data Dragon URLs go through the disk cache)
     try:
-        return requests.get(url, timeout=timeout).json()
+        data = ddragon.get_url(url, timeout=timeout)
+        return json.loads(data) if data is not None else None
     except Exception as e:
         print("JSON 요청 실패", e)
         return None
     
-def load_web_img(url: str, size=None, timeout=10): # WEB image request
+def to_ctk_img(img, size=None):
+    return ctk.CTkImage(light_image=img, dark_image=img, size=size if size else img.size)
+
+# every loader shares one bounded cache: (kind, asset..., size) -> CTkImage
+IMAGE_CACHE = ImageCache(max_bytes=32 * 1024 * 1024)
+
+def cached_img(key, size, make_pil):
+    # CTkImage only builds its PhotoImage when a widget draws it -> safe on workers too
+    img = IMAGE_CACHE.get(key)
+    if img is not None:
+        return img
+    pil = make_pil()
+    img = to_ctk_img(pil, size)
+    if not pil.info.get("placeholder"): # failed loads are retried next time
+        IMAGE_CACHE.put(key, img, pil_nbytes(pil))
+    return img
+
+# pre-resized sheets from mkimg.py (images/atlas), loaded once per (group, size)
+ATLASES = {}
+_ATLAS_LOCK = threading.Lock()
+
+def atlas_tile(group: str, key, size):
+    # ready-to-draw tile or None (no atlas yet / stale) -> caller falls back to resize
+    if not size:
+        return None
+    name = image_atlas.atlas_name(group, size)
+    with _ATLAS_LOCK:
+        if name not in ATLASES:
+            ATLASES[name] = image_atlas.load_atlas(name)
+        atlas = ATLASES[name]
+    return atlas.get(key) if atlas is not None else None
+
+def web_pil(url: str, size=None, timeout=10): # WEB image request -> PIL (thread safe, no Tk)
     try:
-        resp = requests.get(url, timeout=timeout)
-        resp.raise_for_status()
-        img = Image.open(io.BytesIO(resp.content)).convert("RGBA")
+        data = ddragon.get_url(url, timeout=timeout) # versioned icons are cached on disk
+        if data is None:
+            raise RuntimeError(f"다운로드 실패 {url}")
+        img = Image.open(io.BytesIO(data)).convert("RGBA")
         if size is not None:
             img = img.resize(size, Image.LANCZOS)
-        return ctk.CTkImage(light_image=img, dark_image=img, size=size if size else img.size)
+        return img
     except Exception as e:
         print("웹 이미지 로드 실패:", e)
+        img = Image.new("RGBA", size if size else (256, 144), (15, 26, 49, 255))
+        img.info["placeholder"] = True
+        return img
+
+def load_web_img(url: str, size=None, timeout=10): # WEB image request
+    return cached_img(("web", url, size), size, lambda: web_pil(url, size, timeout))
+
+def champ_pil(champ_name: str, size=(100, 100)): # image request -> PIL (thread safe, no Tk)
+    img = atlas_tile("champions", champ_name, size)
+    if img is not None:
+        return img
 
-        fallback = Image.new("RGBA", size if size else (256, 144), (15, 26, 49, 255))
-        return ctk.CTkImage(light_image=fallback, dark_image=fallback, size=fallback.size)
-    
-def load_img(champ_name: str, size=(100, 100)): # image request
     PATH = os.path.join("images/champions", f"{champ_name}.png")
     img = None
 
@@ -89,11 +140,14 @@ def load_img(champ_name: str, size=(100, 100)): # image request
 
     if img is None:
         img = Image.new("RGBA", size, (30, 40, 60, 255))  # placeholder
+        img.info["placeholder"] = True
 
     if size and img.size != size:
         img = img.resize(size, Image.LANCZOS)
+    return img
 
-    return ctk.CTkImage(light_image=img, dark_image=img, size=size)
+def load_img(champ_name: str, size=(100, 100)): # image request
+    return cached_img(("champ", champ_name, size), size, lambda: champ_pil(champ_name, size))
 
 # ---- default setting ----
 ctk.set_appearance_mode("dark")
@@ -105,20 +159,16 @@ root.configure(bg="#0A1428")
 root.geometry("1600x900")
 
 # ---- Riot Data Dragon ----
-VERSION_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
 def get_last_version() -> str:
-    try:
-        return requests.get(VERSION_URL, timeout=10).json()[0]
-    except Exception as e:
-        print("버전 조회 실패", e)
-        return "14.10.1"
+    # cached versions.json, no network on the start-up path (only on the very first run)
+    return ddragon.cached_last_version()
 
 version = get_last_version()
-CHAMP_LIST_URL = f"https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/champion.json"
+CHAMP_LIST_URL = ddragon.asset_url(version, "data/en_US/champion.json")
 
 def listup_marksmen(): # champ get
     try:
-        champion_list = requests.get(CHAMP_LIST_URL).json()["data"] #champ data
+        champion_list = fetch_json(CHAMP_LIST_URL)["data"] #champ data
     except Exception as e:
         raise RuntimeError(f"챔피언 목록 가져오기 실패: {e}")
 
@@ -139,7 +189,6 @@ RUNE_STYLES = { # rune get
     8300: ("Inspiration","영감"),
     8400: ("Resolve",    "결의"),
 }
-RUNE_ICON_CACHE = {}
 
 def rune_style_name_ko(style_id: int):
     try:
@@ -155,27 +204,29 @@ def load_rune_icon(style_id: int, size=(28, 28)):
     except Exception:
         return None
 
-    key = (sid, size)
-    if key in RUNE_ICON_CACHE:
-        return RUNE_ICON_CACHE[key]
+    key = ("rune", sid, size)
+    ctk_img = IMAGE_CACHE.get(key)
+    if ctk_img is not None:
+        return ctk_img
 
     PATH = f"images/runes/{sid}.png"
-    if not os.path.exists(PATH):
+    img = atlas_tile("runes", sid, size)
+    if img is None and not os.path.exists(PATH):
         return print("룬 데이터 로드 실패,")
 
     try:
-        img = Image.open(PATH).convert("RGBA")
-        if size and img.size != size:
-            img = img.resize(size, Image.LANCZOS)
+        if img is None:
+            img = Image.open(PATH).convert("RGBA")
+            if size and img.size != size:
+                img = img.resize(size, Image.LANCZOS)
         ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=size)
-        RUNE_ICON_CACHE[key] = ctk_img
-        return ctk_img
+        return IMAGE_CACHE.put(key, ctk_img, pil_nbytes(img))
     except Exception as e:
         print(f"룬 아이콘 로드 실패 ({sid}):", e)
         return None
 
 # ---- Item metadata ----
-ITEMS_JSON_URL = f"https://ddragon.leagueoflegends.com/cdn/{version}/data/ko_KR/item.json"
+ITEMS_JSON_URL = ddragon.asset_url(version, "data/ko_KR/item.json")
 _ITEM_META = None
 
 def load_item_meta():
@@ -190,49 +241,42 @@ def load_item_meta():
         _ITEM_META = {}
     return _ITEM_META
 
-def is_core_item(item_info: dict) -> bool:
-    # only core item > 1600 gold 
-    if not item_info:
-        return False
-    tags = set(item_info.get("tags", []))
-    name = item_info.get("name", "")
-    gold = (item_info.get("gold") or {}).get("total", 0)
-
-    # exclusive item
-    if "Consumable" in tags: return False
-    if "Trinket"    in tags: return False
-    if "Vision"     in tags: return False
-    if "Boots"      in tags: return False
-    if "Jungle"     in tags: return False
-    if "Support"    in tags: return False
-    if any(k in name for k in ["Elixir", "Potion", "Stealth Ward", "Farsight", "Oracle"]):
-        return False
-
-    return gold >= 1600
-
-def load_item_icon(item_id: int, size=(40, 40)): #item images get
-    url = f"https://ddragon.leagueoflegends.com/cdn/{version}/img/item/{item_id}.png"
-    return load_web_img(url, size=size)
-
-def get_core(item_ids):
+def item_icon_pil(item_id: int, size=(40, 40)): #item images get
+    img = atlas_tile(f"items_{version}", item_id, size) # mkimg.py --items
+    if img is not None:
+        return img
+    url = ddragon.asset_url(version, f"img/item/{item_id}.png")
+    return web_pil(url, size=size)
+
+def load_item_icon(item_id: int, size=(40, 40)):
+    return cached_img(("item", version, item_id, size), size, lambda: item_icon_pil(item_id, size))
+
+def core_item_cells(item_ids, size=(48, 48)):
+    # worker side: (item id, icon CTkImage, short name) for get_core
+    meta = load_item_meta()
+    cells = []
+    for it in [it for it in item_ids if it][:3]:
+        info = meta.get(str(it)) or {}
+        name_ko = info.get("name", str(it))
+        cells.append((it, load_item_icon(it, size), ITEM_ALIAS.get(name_ko, name_ko)))
+    return cells
+
+def get_core(cells, size=(48, 48)):
     # clear grid
     clear_core()
 
-    items = [it for it in item_ids if it] [:3]
-    if not items:
+    if not cells:
         return
 
     grid = ctk.CTkFrame(core_items_frame, fg_color="transparent")
     grid.pack(padx=8, pady=8, fill="x")
 
-    cols = len(items)
+    cols = len(cells)
     for c in range(cols):
         grid.grid_columnconfigure(c, weight=1, uniform="core3")
     grid.grid_rowconfigure(0, weight=1)
 
-    meta = load_item_meta()
-
-    for c, it in enumerate(items):
+    for c, (it, icon, short) in enumerate(cells):
         cell = ctk.CTkFrame(
             grid,
             fg_color="#0F1A31",
@@ -242,13 +286,8 @@ def get_core(item_ids):
         )
         cell.grid(row=0, column=c, padx=6, pady=6, sticky="nsew")
 
-        icon = load_item_icon(it, size=(48, 48))
         ctk.CTkLabel(cell, text="", image=icon).pack(padx=10, pady=(10, 6))
 
-        info = meta.get(str(it)) or {}
-        name_ko = info.get("name", str(it))
-        short = ITEM_ALIAS.get(name_ko, name_ko)  
-
         name_label = ctk.CTkLabel(cell, text=short, text_color="#EAEAEA", justify="center")
         name_label.pack(padx=10, pady=(0, 10))
 
@@ -259,84 +298,110 @@ def clear_core():
 # ---- CSV data, joblib loader ----
 CSV_PATH = "data/my_matches_ml.csv"
 MODEL_PATH = "data/my_win_model.joblib"
-NUM_MEAN_COLS = ["kills", "deaths", "assists", "goldPerMin", "csPerMin", "dmgPerMin", "visionScore", "xpPerMin"]
 
 def load_stats_df():
     if not os.path.exists(CSV_PATH):
         return None
-    df = pd.read_csv(CSV_PATH, encoding="utf-8-sig").copy()
+    from feature_store import load_features
+    df = load_features(CSV_PATH) # columnar, role/patch precomputed
     for c in ["champion", "win", "role"]:
         if c not in df.columns:
             raise ValueError(f"CSV에 '{c}' 컬럼이 없습니다.")
-    df["role"] = df["role"].astype(str).map(normalize_role)
-
-    if "gameVersion" in df.columns:
-        df["patch"] = df["gameVersion"].astype(str).map(to_patch)
-    else:
-        df["patch"] = ""
     return df
 
-def normalize_role(s: str) -> str:
-    s = (s or "").upper()
-    if s in ("BOTTOM", "BOT"): return "ADC"
-    if s in ("UTILITY",): return "SUPPORT"
-    if s == "MIDDLE": return "MID"
-    return s or "UNKNOWN"
-
-def to_patch(ver: str) -> str:
-    if not isinstance(ver, str) or "." not in ver:
-        return ""
-    p = ver.split(".")
-    return f"{p[0]}.{p[1]}" if len(p) >= 2 else ver
-
-def _safe_mode(series, default=None):
-    if len(series) == 0:
-        return default
-    s = series.dropna()
-    if s.empty:
-        return default
-    return s.mode().iloc[0]
-
 def load_model():
+    from compiled_model import load_compiled
+    cm = load_compiled(MODEL_PATH) # analyze_my_winrate.py --compile: numpy only, no sklearn import
+    if cm is not None:
+        return cm
     if not os.path.exists(MODEL_PATH):
         return None
     try:
+        import joblib # unpickling pulls in sklearn
         return joblib.load(MODEL_PATH)
     except Exception as e:
         print("모델 로드 실패:", e)
         return None
 
-def get_champ_summary(df: pd.DataFrame, champ: str) -> dict | None:
-    sub = df[df["champion"] == champ]
-    if sub.empty:
+def _file_sig(*paths):
+    sig = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+            sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+class DataSession:
+    """통계 프레임과 모델을 한 번만 로드해 두고, 파일이 바뀐 경우에만 다시 읽는다."""
+    def __init__(self, csv_path=CSV_PATH, model_path=MODEL_PATH):
+        self.csv_path = csv_path
+        self.model_path = model_path
+        self._df, self._df_sig = None, None
+        self._model, self._model_sig = None, None
+        self._summary, self._summary_sig = None, None
+        self._core, self._core_key = {}, None
+        self._lock = threading.RLock() # click workers share one session
+
+    def _df_paths(self):
+        return (self.csv_path, os.path.splitext(self.csv_path)[0] + ".pkl")
+
+    @property
+    def df(self):
+        with self._lock:
+            sig = _file_sig(*self._df_paths())
+            if sig != self._df_sig:
+                self._df = load_stats_df()
+                self._df_sig = sig
+            return self._df
+
+    @property
+    def summary(self):
+        with self._lock:
+            df = self.df
+            if df is None:
+                return None
+            if self._summary_sig != self._df_sig:
+                from champ_stats import load_champ_summary
+                self._summary = load_champ_summary(self.csv_path, df=df)
+                self._summary_sig = self._df_sig
+            return self._summary
+
+    def core_items(self, meta, top=3):
+        with self._lock:
+            df = self.df
+            key = (self._df_sig, version, top)
+            if self._core_key != key:
+                from champ_stats import core_item_lookup, top_core_items_by_champ
+                if version not in CORE_LOOKUP:
+                    CORE_LOOKUP[version] = core_item_lookup(meta)
+                self._core = top_core_items_by_champ(df, CORE_LOOKUP[version], top)
+                self._core_key = key
+            return self._core
+
+    @property
+    def model(self):
+        with self._lock:
+            sig = _file_sig(self.model_path)
+            if sig != self._model_sig:
+                self._model = load_model()
+                self._model_sig = sig
+            return self._model
+
+CORE_LOOKUP = {} # ddragon version -> core item lookup array
+SESSION = DataSession()
+
+def get_champ_summary(champ: str) -> dict | None:
+    table = SESSION.summary # precomputed per-champion table, O(1) lookup
+    if table is None:
         return None
-    total = len(sub)
-    wins = int(sub["win"].sum())
-    winrate = wins / total if total > 0 else 0.0
-
-    global_queue = int(_safe_mode(df.get("queueId", pd.Series(dtype=float)), 420)) if "queueId" in df.columns else 420
-    global_patch = str(_safe_mode(df.get("patch", pd.Series(dtype=object)), ""))
-
-    out = {
-        "games": total,
-        "wins": wins,
-        "winrate": winrate,
-        "role_mode": _safe_mode(sub["role"], "-"),
-        "rune_primary_mode": int(_safe_mode(sub.get("runePrimary", pd.Series(dtype=float)), 8000))
-                                if "runePrimary" in sub.columns else "-",
-        "rune_sub_mode": int(_safe_mode(sub.get("runeSub", pd.Series(dtype=float)), 8300))
-                                if "runeSub" in sub.columns else "-",
-        "queue_mode": int(_safe_mode(sub.get("queueId", pd.Series(dtype=float)), global_queue)) if "queueId" in df.columns else global_queue,
-        "patch_mode": str(_safe_mode(sub.get("patch", pd.Series(dtype=object)), global_patch)),
-    }
-    for c in NUM_MEAN_COLS:
-        out[c] = float(sub[c].mean()) if c in sub.columns else 0.0
-    return out
+    from champ_stats import champion_row
+    return champion_row(table, champ)
 
 # ---- 3 core items from CSV ----
-ITEM_COLS = [f"item{i}" for i in range(7)]
-
-def top3_core_items_for_champ(df: pd.DataFrame, champ: str, top=3):
+def top3_core_items_for_champ(df, champ: str, top=3):
+    from champ_stats import ITEM_COLS
     meta = load_item_meta()
     if not meta:
         return []
@@ -344,30 +409,8 @@ def top3_core_items_for_champ(df: pd.DataFrame, champ: str, top=3):
     if not all(c in df.columns for c in ITEM_COLS):
         return []  # empty item col
 
-    sub = df[df["champion"] == champ]
-    if sub.empty:
-        return []
-
-    from collections import Counter
-    bag = Counter()
-
-    for _, row in sub[ITEM_COLS].iterrows():
-        for it in row.values:
-            try:
-                it = int(it)
-            except Exception:
-                continue
-            if it <= 0:
-                continue
-            info = meta.get(str(it))
-            if is_core_item(info):
-                bag[it] += 1
-
-    if not bag:
-        return []
-
-    best = [it for it, _ in bag.most_common(top)]
-    return best
+    # every champion is counted in one pass, then cached until the data/version changes
+    return SESSION.core_items(meta, top).get(champ, [])
 
 # ---- header ----
 header = ctk.CTkLabel(
@@ -467,61 +510,62 @@ def show_status(msg: str):
         status_label.pack(pady=(0, 0))
 
 # ---- champion button ----
+# heavy work (stats, item icons over the network, predict_proba) runs on a worker,
+# results come back to the Tk thread through RESULTS, polled with root.after
+EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="champ")
+RESULTS = queue.Queue()
+CLICK_GEN = 0      # bumped on every click, older work is discarded
+_PENDING = None
+CLICK_TIMES = []
+
 def on_champion_click(name: str):
+    global CLICK_GEN, _PENDING
+    t0 = time.perf_counter()
+    CLICK_GEN += 1
+    gen = CLICK_GEN
+    if _PENDING is not None:
+        _PENDING.cancel() # not started yet -> dropped, running -> result ignored
+
     # clear table
     info_title.configure(text=CHAMP_ALIAS.get(name, name))
     clear_stats()
     clear_core()
-
     show_status("불러오는 중...")
 
-    # get champ img
-    ctk_img = load_img(name, size=(180, 180))
-    champ_img_label.configure(image=ctk_img, text="")
-    champ_img_label.image = ctk_img
+    _PENDING = EXECUTOR.submit(load_champion_data, name, gen)
+    _PENDING.add_done_callback(lambda fut: RESULTS.put((gen, name, t0, fut)))
 
-    df = load_stats_df() # get data
-    
+def load_champion_data(name: str, gen: int) -> dict | None:
+    """워커 스레드: 요약, 코어 아이템 아이콘, 예측 승률 계산. 다른 챔피언이 클릭되면 중단 (None)."""
+    def stale():
+        return gen != CLICK_GEN
+
+    out = {"portrait": load_img(name, size=(180, 180))} # cached after the first click
+
+    df = SESSION.df # resident, reloaded only when the files change
     if df is None:
-        show_status("CSV가 없습니다.")
-        return
+        out["status"] = "CSV가 없습니다."
+        return out
 
     try:
-        summary = get_champ_summary(df, name)
+        summary = get_champ_summary(name)
     except Exception as e:
-        show_status("요약 중 오류: {e}")
-        return
+        out["status"] = f"요약 중 오류: {e}"
+        return out
 
     if summary is None:
-        show_status("해당 챔피언으로 플레이한 기록이 없습니다.")
-        return
-
-    hide_status()
-
-    # ---- table mean value ----
-    put_row("플레이", f"{summary['games']}전 {summary['wins']}승")
-    put_row("승률", f"{summary['winrate']*100:.1f}%")
-    put_row("포지션", f"{summary['role_mode']}")
-
-    put_row_rune("주 룬", f"{summary['rune_primary_mode']}")
-    put_row_rune("부 룬", f"{summary['rune_sub_mode']}")
-
-    put_row("K / D / A", f"{format_float(summary['kills'],1)} / {format_float(summary['deaths'],1)} / {format_float(summary['assists'],1)}")
-    put_row("CS/Min", format_float(summary["csPerMin"], 2))
-    put_row("Gold/Min", format_float(summary["goldPerMin"], 1))
-    put_row("Dmg/Min", format_float(summary["dmgPerMin"], 1))
-    put_row("XP/Min", format_float(summary["xpPerMin"], 1))
+        out["status"] = "해당 챔피언으로 플레이한 기록이 없습니다."
+        return out
+    out["summary"] = summary
+    if stale():
+        return None
 
-    # ---- table item core ----
-    core3 = top3_core_items_for_champ(df, name, top=3)
-    get_core(core3)
+    # ---- item core ----
+    out["core"] = core_item_cells(top3_core_items_for_champ(df, name, top=3))
+    if stale():
+        return None
 
     # ---- predict winrate ----
-    pipe = load_model()
-    if pipe is None:
-        put_row("예측 승률", "모델 없음 → analyze_my_winrate.py --train")
-        return
-
     #predict table
     row = {
         "champion": name,
@@ -539,12 +583,90 @@ def on_champion_click(name: str):
         "visionScore": summary["visionScore"],
         "xpPerMin": summary["xpPerMin"],
     }
+    # warm local server first (python predict_server.py), in-process model otherwise
+    try:
+        proba = predict_server.predict_rows([row], timeout=1.0)[0]["prob_win"]
+        out["predict"] = f"{proba*100:.1f}%"
+        return out
+    except Exception:
+        pass
+
+    pipe = SESSION.model
+    if pipe is None:
+        out["predict"] = "모델 없음 → analyze_my_winrate.py --train"
+        return out
+
+    import pandas as pd
     X = pd.DataFrame([row])
     try:
         proba = pipe.predict_proba(X)[:, 1][0]
-        put_row("예측 승률", f"{proba*100:.1f}%")
+        out["predict"] = f"{proba*100:.1f}%"
     except Exception as e:
-        put_row("예측 승률", f"예측 실패: {e}")
+        out["predict"] = f"예측 실패: {e}"
+    return out
+
+def poll_results():
+    try:
+        while True:
+            gen, name, t0, fut = RESULTS.get_nowait()
+            if gen != CLICK_GEN or fut.cancelled():
+                continue # stale click
+            try:
+                data = fut.result()
+            except Exception as e:
+                show_status(f"불러오기 실패: {e}")
+                continue
+            if data is None:
+                continue
+            render_champion(name, data)
+            # idle callbacks run after the pending redraws -> click-to-render latency
+            root.after_idle(lambda n=name, t=t0: report_click(n, t))
+    except queue.Empty:
+        pass
+    root.after(30, poll_results)
+
+def report_click(name: str, t0: float):
+    ms = (time.perf_counter() - t0) * 1000
+    CLICK_TIMES.append(ms)
+    avg = sum(CLICK_TIMES) / len(CLICK_TIMES)
+    st = IMAGE_CACHE.stats()
+    print(f"[click] {name}: {ms:.1f} ms (평균 {avg:.1f} ms, {len(CLICK_TIMES)}회)"
+          f"  이미지 캐시 {st['entries']}개 {st['bytes'] / 1e6:.1f}/{st['max_bytes'] / 1e6:.0f} MB"
+          f" hit {st['hits']} / miss {st['misses']}")
+
+def render_champion(name: str, data: dict):
+    # Tk thread only: turn the worker's result into widgets
+    ctk_img = data["portrait"]
+    champ_img_label.configure(image=ctk_img, text="")
+    champ_img_label.image = ctk_img
+
+    if "summary" not in data:
+        show_status(data.get("status", ""))
+        return
+    summary = data["summary"]
+
+    hide_status()
+
+    # ---- table mean value ----
+    put_row("플레이", f"{summary['games']}전 {summary['wins']}승")
+    put_row("승률", f"{summary['winrate']*100:.1f}%")
+    put_row("포지션", f"{summary['role_mode']}")
+
+    put_row_rune("주 룬", f"{summary['rune_primary_mode']}")
+    put_row_rune("부 룬", f"{summary['rune_sub_mode']}")
+
+    put_row("K / D / A", f"{format_float(summary['kills'],1)} / {format_float(summary['deaths'],1)} / {format_float(summary['assists'],1)}")
+    put_row("CS/Min", format_float(summary["csPerMin"], 2))
+    put_row("Gold/Min", format_float(summary["goldPerMin"], 1))
+    put_row("Dmg/Min", format_float(summary["dmgPerMin"], 1))
+    put_row("XP/Min", format_float(summary["xpPerMin"], 1))
+
+    # ---- table item core ----
+    get_core(data.get("core", []))
+
+    # ---- predict winrate ----
+    if "predict" in data:
+        put_row("예측 승률", data["predict"])
 
 
 # ---- creat button ----
@@ -555,12 +677,16 @@ except RuntimeError as e:
     err = ctk.CTkLabel(left, text=str(e), text_color="#FF7B7B", font=("Segoe UI", 16))
     err.grid(row=0, column=0, padx=8, pady=8, sticky="w")
 
+# buttons go up at once with a placeholder, portraits are decoded on a thread and
+# attached a few per tick, so the window shows before any image work is done
+PLACEHOLDER_IMG = to_ctk_img(Image.new("RGBA", (100, 100), (30, 40, 60, 255)), (100, 100))
+PORTRAITS = queue.Queue()
+STARTUP = {"first_frame": None, "grid": None}
+
 images = {}
+buttons = {}
 cols = 7
 for i, name in enumerate(champs):
-    ctk_img = load_img(name, size=(100, 100))
-    images[name] = ctk_img
-
     btn = ctk.CTkButton(
         left,
         text=CHAMP_ALIAS.get(name, name),
@@ -568,7 +694,7 @@ for i, name in enumerate(champs):
         fg_color="#1E2328",
         hover_color="#2A3238",
         text_color="#EAEAEA",
-        image=ctk_img,
+        image=PLACEHOLDER_IMG,
         compound="top",
         corner_radius=10,
         border_color="#785A28",
@@ -578,8 +704,69 @@ for i, name in enumerate(champs):
         command=lambda n=name: on_champion_click(n),
     )
     btn.grid(row=i // cols, column=i % cols, padx=8, pady=8, sticky="nsew")
+    buttons[name] = btn
 
 for c in range(cols):
     left.grid_columnconfigure(c, weight=1)
 
-root.mainloop()
\ No newline at end of file
+def load_portraits(names):
+    # worker thread: CTkImage via the shared cache (atlas tile or decode + resize)
+    for name in names:
+        try:
+            img = load_img(name, size=(100, 100))
+        except Exception as e:
+            # every button must get an entry, or the grid never counts as complete
+            print(f"{name} 이미지 로드 실패:", e)
+            img = PLACEHOLDER_IMG
+        PORTRAITS.put((name, img or PLACEHOLDER_IMG))
+
+def attach_portraits(batch=4):
+    # Tk thread: a few buttons per tick keeps the window responsive while filling
+    n = 0
+    try:
+        while n < batch:
+            name, ctk_img = PORTRAITS.get_nowait()
+            images[name] = ctk_img
+            buttons[name].configure(image=ctk_img)
+            n += 1
+    except queue.Empty:
+        pass
+    if len(images) < len(buttons):
+        root.after(1 if n else 10, attach_portraits)
+    else:
+        root.after_idle(lambda: report_startup("grid"))
+
+def report_startup(stage: str):
+    if STARTUP[stage] is not None:
+        return
+    STARTUP[stage] = (time.perf_counter() - T_START) * 1000
+    if stage == "grid" and STARTUP["first_frame"] is not None:
+        print(f"[startup] 첫 화면 {STARTUP['first_frame']:.0f} ms, 그리드 완성 {STARTUP['grid']:.0f} ms ({len(buttons)}개)"
+              f", import {(T_IMPORTS - T_START) * 1000:.0f} ms", flush=True)
+        if EXIT_AFTER_STARTUP:
+            root.after(0, root.quit)
+        else:
+            EXECUTOR.submit(prewarm)
+            ddragon.revalidate_versions_async()
+
+def prewarm():
+    # after the grid is complete: load stats/model in the background so the first click is fast
+    try:
+        SESSION.summary
+        SESSION.model
+        load_item_meta()
+    except Exception as e:
+        print("미리 불러오기 실패:", e)
+
+def on_first_map(event):
+    if event.widget is root:
+        report_startup("first_frame")
+        if STARTUP["grid"] is not None: # grid finished before the window mapped
+            STARTUP["grid"] = None
+            report_startup("grid")
+
+root.bind("<Map>", on_first_map, add="+")
+threading.Thread(target=load_portraits, args=(list(buttons),), daemon=True, name="portraits").start()
+root.after_idle(attach_portraits)
+root.after(30, poll_results)
+root.mainloop()
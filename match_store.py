@@ -0,0 +1,188 @@
+import os, re, json, gzip, zlib
+
+STORE_PATH = "data/my_matches_raw.jsonl.gz"
+LEGACY_JSONL_PATH = "data/my_matches_raw.jsonl"
+
+_MATCH_ID_RE = re.compile(r'"matchId"\s*:\s*"([^"]+)"')
+
+def _match_id(line: str):
+    m = _MATCH_ID_RE.search(line[:512])
+    if m:
+        return m.group(1)
+    return json.loads(line)["metadata"]["matchId"]
+
+class MatchStore:
+    """매치 하나 = gzip 멤버 하나로 이어 붙인 raw 저장소 + matchId -> (offset, length) 인덱스.
+
+    파일 전체가 그대로 gzip 이라 gzip.open / zcat 으로 순차 읽기가 되고,
+    인덱스로 매치 하나만 seek 해서 풀 수도 있다.
+    """
+    def __init__(self, path=STORE_PATH, index_path=None):
+        self.path = path
+        self.index_path = index_path or re.sub(r"\.jsonl\.gz$", "", path) + ".idx"
+        self._index = None
+        self._fh = None
+
+    # ---- index ----
+    @property
+    def index(self) -> dict:
+        if self._index is None:
+            self._index = self._load_index()
+        return self._index
+
+    def _load_index(self):
+        index, end, stale = {}, 0, False
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                for line in f:
+                    parts = line.rstrip("\n").split("\t")
+                    if len(parts) != 3:
+                        continue
+                    mid, off, length = parts[0], int(parts[1]), int(parts[2])
+                    if off + length > size:
+                        stale = True
+                        break
+                    index[mid] = (off, length)
+                    end = max(end, off + length)
+        if end < size:
+            # frames written after the last index line (crash between the two writes)
+            index.update(self._scan(end, size))
+            stale = True
+        if stale:
+            self._rewrite_index(index)
+        return index
+
+    def _scan(self, start, size):
+        found = {}
+        with open(self.path, "rb") as f:
+            off = start
+            while off < size:
+                f.seek(off)
+                d = zlib.decompressobj(wbits=31)
+                out, used = [], 0
+                while not d.eof:
+                    chunk = f.read(1 << 16)
+                    if not chunk:
+                        break
+                    out.append(d.decompress(chunk))
+                    used += len(chunk)
+                if not d.eof:
+                    break
+                length = used - len(d.unused_data)
+                try:
+                    found[_match_id(b"".join(out).decode("utf-8"))] = (off, length)
+                except Exception:
+                    break
+                off += length
+        if off < size:
+            print(f"불완전한 마지막 기록 정리: {self.path}")
+            with open(self.path, "r+b") as f:
+                f.truncate(off)
+        return found
+
+    def _rewrite_index(self, index):
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for mid, (off, length) in sorted(index.items(), key=lambda kv: kv[1][0]):
+                f.write(f"{mid}\t{off}\t{length}\n")
+        os.replace(tmp, self.index_path)
+
+    # ---- read ----
+    def ids(self) -> set:
+        return set(self.index)
+
+    def __contains__(self, match_id):
+        return match_id in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def get_raw(self, match_id) -> str | None:
+        loc = self.index.get(match_id)
+        if loc is None:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(loc[0])
+            return gzip.decompress(f.read(loc[1])).decode("utf-8")
+
+    def get(self, match_id) -> dict | None:
+        raw = self.get_raw(match_id)
+        return json.loads(raw) if raw is not None else None
+
+    def iter_raw(self):
+        # sequential stream of JSON lines, same shape as the old jsonl file
+        if not os.path.exists(self.path):
+            return
+        self.index  # repairs a truncated tail before gzip.open reads it
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield line
+
+    def iter_raw_ids(self, match_ids):
+        # only the given matches, in file order, one seek per frame
+        locs = sorted(self.index[m] for m in match_ids if m in self.index)
+        if not locs:
+            return
+        with open(self.path, "rb") as f:
+            for off, length in locs:
+                f.seek(off)
+                yield gzip.decompress(f.read(length)).decode("utf-8")
+
+    def __iter__(self):
+        for line in self.iter_raw():
+            yield json.loads(line)
+
+    # ---- write ----
+    def append(self, match: dict):
+        mid = match["metadata"]["matchId"]
+        if mid in self.index:
+            return False
+        frame = gzip.compress((json.dumps(match, ensure_ascii=False) + "\n").encode("utf-8"), mtime=0)
+        if self._fh is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._fh = open(self.path, "ab")
+        off = self._fh.seek(0, os.SEEK_END)
+        self._fh.write(frame)
+        self._fh.flush()
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(f"{mid}\t{off}\t{len(frame)}\n")
+        self.index[mid] = (off, len(frame))
+        return True
+
+    def sync(self):
+        if self._fh is not None:
+            os.fsync(self._fh.fileno())
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def import_jsonl(self, path=LEGACY_JSONL_PATH):
+        added = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    added += self.append(json.loads(line))
+                except Exception as e:
+                    print("skip", e)
+        return added
+
+def open_store(path=STORE_PATH, legacy_path=LEGACY_JSONL_PATH) -> MatchStore:
+    # first run after the switch: move the old jsonl into the compressed store once
+    store = MatchStore(path)
+    if not os.path.exists(path) and os.path.exists(legacy_path):
+        n = store.import_jsonl(legacy_path)
+        store.sync()
+        print(f"{legacy_path} -> {path} 변환 완료 ({n}개)")
+    return store
@@ -1,27 +1,22 @@
-import os
+import os, json, hashlib, argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+import ddragon
+import image_atlas
 
-VERSION_URL = "https://ddragon.leagueoflegends.com/api/versions.json"
-def get_last_version() -> str:
-    try:
-        return requests.get(VERSION_URL, timeout=10).json()[0]
-    except Exception as e:
-        print("버전 조회 실패, 인터넷 연결을 확인하세요.", e)
-        return "14.10.1"
-
-version = get_last_version()
-CHAMP_LIST_URL = f"https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/champion.json"
-print(f"최신 버전: {version}")
-
+MANIFEST_PATH = "images/manifest.json"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
-# ---- get champion images ----
-def listup_marksmen():  
+# ---- get champion list ----
+def listup_marksmen(version):
     try:
-        champion_list = requests.get(CHAMP_LIST_URL).json()["data"] #champ data
+        champion_list = ddragon.get_json(version, "data/en_US/champion.json")["data"] #champ data
     except Exception as e:
         raise RuntimeError(f"챔피언 목록 가져오기 실패", e)
 
+    #In DDragon, champ info tags, Marksman(adc)
     ADC_EXTRAS = {"Ziggs", "Nilah"}
     champions = [name for name, info in champion_list.items() if "Marksman" in info.get("tags", []) or name in ADC_EXTRAS]
 
@@ -29,28 +24,10 @@ def listup_marksmen():
 
     filterchampions = sorted([name for name in champions if name not in filternotadc]) #filtering not adc
     filterchampions.append("Azir") #Azir is not adc but my fav;
-        
-    return filterchampions
-champion_list = listup_marksmen()
-
-os.makedirs("images/champions", exist_ok=True) #make images dir
-
-#In DDragon, champ info tags, Marksman(adc)
-ADC_EXTRAS = {"Ziggs", "Nilah"}
-
-for champ_name in tqdm(champion_list, desc="원딜 챔피언 이미지 다운로드 중"):
-    IMG_URL = f"https://ddragon.leagueoflegends.com/cdn/{version}/img/champion/{champ_name}.png"
-    IMG_PATH = f"images/champions/{champ_name}.png"
 
-    #if not images, make them
-    if not os.path.exists(IMG_PATH):
-        IMG_DATA = requests.get(IMG_URL).content
-        with open(IMG_PATH, "wb") as f:
-            f.write(IMG_DATA)
-
-print("원딜 챔피언 이미지 다운로드 완료")
+    return filterchampions
 
-# ---- get rune images -----
+# ---- rune styles ----
 # ID: 8000 정밀, 8100 지배, 8200 마법, 8300 영감, 8400 결의
 RUNE_STYLES = {
     8000: "Precision",
@@ -69,17 +46,135 @@ DDRAGONE_RUNE_STYLES = {
     8400: "7204_Resolve.png",
 }
 
-os.makedirs("images/runes", exist_ok=True)
-
-for style_id in tqdm(RUNE_STYLES.keys(), desc="룬 스타일 아이콘 다운로드 중"):
-
-    IMG_PATH = f"images/runes/{style_id}.png"
-    IMG_URL = f"https://ddragon.leagueoflegends.com/cdn/img/perk-images/Styles/{DDRAGONE_RUNE_STYLES[style_id]}"
-
-    #if not images, make them
-    if not os.path.exists(IMG_PATH):
-        IMG_DATA = requests.get(IMG_URL).content
-        with open(IMG_PATH, "wb") as f:
-            f.write(IMG_DATA)
-
-print("룬 아이콘 다운로드 완료")
+# ---- asset list ----
+def champion_assets(version):
+    return [(f"images/champions/{name}.png", ddragon.asset_url(version, f"img/champion/{name}.png"))
+            for name in listup_marksmen(version)]
+
+def rune_assets():
+    return [(f"images/runes/{sid}.png", f"{ddragon.CDN_URL}/cdn/img/perk-images/Styles/{fname}")
+            for sid, fname in DDRAGONE_RUNE_STYLES.items()]
+
+def item_assets(version):
+    # written straight into the Data Dragon cache, where the GUI looks for item icons
+    items = (ddragon.get_json(version, "data/ko_KR/item.json") or {}).get("data", {})
+    out = []
+    for item_id in sorted(items, key=int):
+        rel = f"cdn/{version}/img/item/{item_id}.png"
+        out.append((ddragon.cache_path(rel), f"{ddragon.CDN_URL}/{rel}"))
+    return out
+
+# ---- manifest ----
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"version": None, "assets": {}}
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def needs_fetch(path, url, entry, verify=False):
+    # missing, new patch (url carries the version), truncated or altered file
+    if entry is None or entry.get("url") != url or not os.path.exists(path):
+        return True
+    if os.path.getsize(path) != entry.get("size"):
+        return True
+    return verify and sha256_file(path) != entry.get("sha256")
+
+# ---- download ----
+def make_session(workers):
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=workers))
+    return s
+
+def download(session, path, url, timeout=10):
+    r = session.get(url, timeout=timeout)
+    r.raise_for_status()
+    data = r.content
+    expected = r.headers.get("Content-Length")
+    if expected is not None and int(expected) != len(data) and not r.headers.get("Content-Encoding"):
+        raise IOError(f"잘린 응답 ({len(data)}/{expected} bytes)")
+    if not data.startswith(PNG_SIGNATURE):
+        raise IOError("PNG 파일이 아닙니다")
+
+    # atomic: a partial download never shows up under the final name
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.part"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return {"url": url, "size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+
+def sync_assets(assets, version, workers=8, verify=False, desc="이미지 동기화"):
+    manifest = load_manifest()
+    entries = manifest.setdefault("assets", {})
+    todo = [(path, url) for path, url in assets if needs_fetch(path, url, entries.get(path), verify)]
+
+    failed = []
+    if todo:
+        session = make_session(workers)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = {ex.submit(download, session, path, url): path for path, url in todo}
+            for fut in tqdm(as_completed(futures), total=len(futures), desc=desc):
+                path = futures[fut]
+                try:
+                    entries[path] = {**fut.result(), "version": version}
+                except Exception as e:
+                    print("다운로드 실패", path, e)
+                    failed.append(path)
+
+    manifest["version"] = version
+    save_manifest(manifest)
+    print(f"{desc}: {len(assets)}개 중 {len(todo) - len(failed)}개 받음, {len(assets) - len(todo)}개 최신, 실패 {len(failed)}개")
+    return failed
+
+# ---- pre-resized atlas ----
+def build_atlases(assets_by_group, version):
+    # one sheet per (group, UI size) so the GUI never resamples at runtime
+    sizes = {"champions": image_atlas.CHAMP_SIZES, "runes": image_atlas.RUNE_SIZES, "items": image_atlas.ITEM_SIZES}
+    for group, assets in assets_by_group.items():
+        sources = {os.path.splitext(os.path.basename(path))[0]: path for path, _ in assets if os.path.exists(path)}
+        name = f"items_{version}" if group == "items" else group # item icons change every patch
+        for size in sizes[group]:
+            out = image_atlas.build_atlas(image_atlas.atlas_name(name, size), sources, size)
+            if out:
+                print(f"아틀라스 생성: {out} ({len(sources)}개)")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, default=8, help="동시 다운로드 수")
+    ap.add_argument("--items", action="store_true", help="현재 버전 아이템 아이콘도 미리 받기")
+    ap.add_argument("--verify", action="store_true", help="sha256 으로 기존 파일까지 검증")
+    ap.add_argument("--no-atlas", action="store_true", help="리사이즈 아틀라스 생성 건너뛰기")
+    args = ap.parse_args()
+
+    version = ddragon.last_version()
+    print(f"최신 버전: {version}")
+
+    groups = {"champions": champion_assets(version), "runes": rune_assets()}
+    if args.items:
+        groups["items"] = item_assets(version)
+
+    sync_assets(groups["champions"], version, args.workers, args.verify, desc="원딜 챔피언 이미지")
+    sync_assets(groups["runes"], version, args.workers, args.verify, desc="룬 스타일 아이콘")
+    if args.items:
+        sync_assets(groups["items"], version, args.workers, args.verify, desc="아이템 아이콘")
+
+    if not args.no_atlas:
+        build_atlases(groups, version)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+# mock_riot_server.py
+import os, io, json, math, time, random, shutil, argparse, tempfile, threading, contextlib
+from functools import lru_cache
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+import synth_matches
+
+HOST = "127.0.0.1"
+PORT = int(os.environ.get("MOCK_RIOT_PORT", 8767))
+APP_LIMITS = "20:1,100:120"    # development key
+METHOD_LIMITS = "2000:10"      # match-v5, per method
+BENCH_APP_LIMITS = "50:1,300:10" # bench default: tight enough to hit, short enough to finish
+IDS_PATH = "/lol/match/v5/matches/by-puuid/"
+MATCH_PATH = "/lol/match/v5/matches/"
+
+def parse_limits(header: str):
+    # "20:1,100:120" -> [(20, 1.0), (100, 120.0)]
+    out = []
+    for part in (header or "").split(","):
+        count, _, window = part.partition(":")
+        if window:
+            out.append((int(count), float(window)))
+    return out
+
+# ---- rate limit (server side) ----
+class FixedWindows:
+    """Riot 방식 고정 윈도: 윈도는 그 윈도의 첫 요청 때 시작하고, 거절된 요청은 세지 않음"""
+    def __init__(self, limits):
+        self.limits = limits
+        self.state = {w: [0.0, 0] for _, w in limits} # window -> [start, count]
+
+    def retry_after(self, now) -> float:
+        wait = 0.0
+        for count, w in self.limits:
+            st = self.state[w]
+            if now >= st[0] + w:
+                st[0], st[1] = now, 0
+            if st[1] >= count:
+                wait = max(wait, st[0] + w - now)
+        return wait
+
+    def hit(self):
+        for st in self.state.values():
+            st[1] += 1
+
+    def limit_header(self):
+        return ",".join(f"{n}:{w:g}" for n, w in self.limits)
+
+    def count_header(self):
+        return ",".join(f"{self.state[w][1]}:{w:g}" for _, w in self.limits)
+
+# ---- mock API ----
+@lru_cache(maxsize=2048)
+def _match_body(i, puuid, seed, n) -> bytes:
+    return json.dumps(synth_matches.make_match(i, puuid, seed, n), ensure_ascii=False).encode("utf-8")
+
+def _error(code, message):
+    return code, {}, json.dumps({"status": {"message": message, "status_code": code}}).encode("utf-8")
+
+class MockRiot:
+    """match-v5 ids / match 엔드포인트 흉내. 레이트 리밋 헤더, 429 + Retry-After, 지연/5xx/연결 끊김 주입."""
+    def __init__(self, n_matches=1000, puuid=synth_matches.SYNTH_PUUID, seed=0,
+                 app_limits=APP_LIMITS, method_limits=METHOD_LIMITS, key=None,
+                 latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, drop_rate=0.0, throttle_rate=0.0):
+        self.n = n_matches
+        self.puuid = puuid
+        self.seed = seed
+        self.key = key
+        self.latency_ms, self.jitter_ms = latency_ms, jitter_ms
+        self.error_rate, self.drop_rate, self.throttle_rate = error_rate, drop_rate, throttle_rate
+        self.app = FixedWindows(parse_limits(app_limits))
+        self.methods = {m: FixedWindows(parse_limits(method_limits)) for m in ("match-ids", "match")}
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts = {"requests": 0, "ok": 0, "4xx": 0, "401": 0, "429_app": 0, "429_method": 0,
+                       "429_service": 0, "5xx": 0, "dropped": 0}
+        self.accepted = [] # arrival time of every request that passed the limits
+        self.started = time.monotonic()
+
+    def _route(self, path):
+        if path.startswith(IDS_PATH) and path.endswith("/ids"):
+            return "match-ids", path[len(IDS_PATH):-len("/ids")]
+        if path.startswith(MATCH_PATH) and "/" not in path[len(MATCH_PATH):]:
+            return "match", path[len(MATCH_PATH):]
+        return None, None
+
+    def handle(self, url, headers):
+        """-> (status, headers, body), 또는 연결을 끊어야 하면 None"""
+        parts = urlsplit(url)
+        method, arg = self._route(parts.path)
+        with self._lock:
+            self.counts["requests"] += 1
+            if method is None:
+                return _error(404, "Data not found - route not found")
+            if not headers.get("X-Riot-Token") or (self.key and headers.get("X-Riot-Token") != self.key):
+                self.counts["401"] += 1
+                return _error(401, "Unauthorized")
+
+            now = time.monotonic()
+            app_wait = self.app.retry_after(now)
+            method_wait = self.methods[method].retry_after(now)
+            limit_headers = {
+                "X-App-Rate-Limit": self.app.limit_header(),
+                "X-App-Rate-Limit-Count": self.app.count_header(),
+                "X-Method-Rate-Limit": self.methods[method].limit_header(),
+                "X-Method-Rate-Limit-Count": self.methods[method].count_header(),
+            }
+            if app_wait > 0 or method_wait > 0:
+                kind = "application" if app_wait >= method_wait else "method"
+                self.counts["429_app" if kind == "application" else "429_method"] += 1
+                code, _, body = _error(429, "Rate limit exceeded")
+                return code, {**limit_headers, "Retry-After": str(math.ceil(max(app_wait, method_wait))),
+                              "X-Rate-Limit-Type": kind}, body
+            self.app.hit()
+            self.methods[method].hit()
+            self.accepted.append(now)
+            limit_headers["X-App-Rate-Limit-Count"] = self.app.count_header()
+            limit_headers["X-Method-Rate-Limit-Count"] = self.methods[method].count_header()
+
+            # faults, after the request was counted like a real edge would
+            roll = self.rng.random()
+            delay = max(0.0, self.rng.gauss(self.latency_ms, self.jitter_ms)) / 1000 if self.latency_ms else 0.0
+            if roll < self.drop_rate:
+                self.counts["dropped"] += 1
+                fault = "drop"
+            elif roll < self.drop_rate + self.error_rate:
+                self.counts["5xx"] += 1
+                fault = self.rng.choice([500, 502, 503, 504])
+            elif roll < self.drop_rate + self.error_rate + self.throttle_rate:
+                # upstream service limit: 429 without Retry-After
+                self.counts["429_service"] += 1
+                fault = "service"
+            else:
+                fault = None
+
+        if delay:
+            time.sleep(delay) # outside the lock: concurrent requests overlap like on the real API
+        if fault == "drop":
+            return None
+        if fault == "service":
+            code, _, body = _error(429, "Rate limit exceeded")
+            return code, {"X-Rate-Limit-Type": "service"}, body
+        if fault is not None:
+            code, _, body = _error(fault, "Internal server error")
+            return code, limit_headers, body
+
+        query = parse_qs(parts.query)
+        if method == "match-ids":
+            resp = self._ids(arg, query)
+        else:
+            resp = self._match(arg)
+        with self._lock:
+            self.counts["ok" if resp[0] == 200 else "4xx"] += 1
+        return resp[0], {**limit_headers, **resp[1]}, resp[2]
+
+    def _ids(self, puuid, query):
+        q = lambda k, d: int(query.get(k, [d])[0])
+        start, count = q("start", 0), q("count", 20)
+        if not 0 <= count <= 100:
+            return _error(400, "Bad request - count must be 0..100")
+        if puuid != self.puuid or q("queue", 420) != 420:
+            return 200, {}, b"[]"
+        # newest first; match i starts at FIRST_GAME_START + i * GAME_INTERVAL_MS
+        lo = 0
+        if "startTime" in query:
+            lo = max(0, math.ceil((q("startTime", 0) * 1000 - synth_matches.FIRST_GAME_START) / synth_matches.GAME_INTERVAL_MS))
+        hi = self.n - 1
+        if "endTime" in query:
+            hi = min(hi, (q("endTime", 0) * 1000 - synth_matches.FIRST_GAME_START) // synth_matches.GAME_INTERVAL_MS)
+        top = hi - start
+        ids = [f"{synth_matches.PLATFORM}_{synth_matches.FIRST_MATCH_NO + i}"
+               for i in range(top, max(lo, top - count + 1) - 1, -1)]
+        return 200, {}, json.dumps(ids).encode("utf-8")
+
+    def _match(self, match_id):
+        platform, _, no = match_id.partition("_")
+        i = int(no) - synth_matches.FIRST_MATCH_NO if no.isdigit() and platform == synth_matches.PLATFORM else -1
+        if not 0 <= i < self.n:
+            return _error(404, "Data not found - match file not found")
+        return 200, {}, _match_body(i, self.puuid, self.seed, self.n)
+
+    def stats(self) -> dict:
+        with self._lock:
+            elapsed = time.monotonic() - self.started
+            peaks = {}
+            for count, w in self.app.limits:
+                # busiest sliding window of accepted requests (fixed windows allow up to 2x at a boundary)
+                best, j = 0, 0
+                for i, t in enumerate(self.accepted):
+                    while self.accepted[j] <= t - w:
+                        j += 1
+                    best = max(best, i - j + 1)
+                peaks[f"{count}:{w:g}"] = best
+            return {**self.counts, "accepted": len(self.accepted), "elapsed": elapsed, "peak_window": peaks}
+
+# ---- HTTP ----
+def make_handler(mock: MockRiot):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if self.path == "/__mock/stats":
+                code, headers, body = 200, {}, json.dumps(mock.stats()).encode("utf-8")
+            else:
+                resp = mock.handle(self.path, self.headers)
+                if resp is None:
+                    self.close_connection = True # no status line: client sees a dropped connection
+                    return
+                code, headers, body = resp
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json;charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+def start_server(mock: MockRiot, host=HOST, port=0):
+    """백그라운드 스레드로 서버 시작 (port=0: 빈 포트). (httpd, base_url) 반환"""
+    httpd = ThreadingHTTPServer((host, port), make_handler(mock))
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True, name="mock-riot").start()
+    return httpd, f"http://{host}:{httpd.server_address[1]}"
+
+# ---- fetcher harness ----
+def min_seconds(n_requests, limits) -> float:
+    # lower bound under fixed windows: the k-th full window can only open after (k-1) windows
+    return max([(math.ceil(n_requests / c) - 1) * w for c, w in limits] + [0.0])
+
+def run_fetch(mock_kw: dict, workers=8, total=None) -> dict:
+    """mock 서버 + load_my_matches.sync_matches 한 번 실행, 처리량과 레이트 리밋 대비 효율 반환"""
+    import load_my_matches as lmm
+    mock = MockRiot(**mock_kw)
+    httpd, base = start_server(mock)
+    work = tempfile.mkdtemp(prefix="mock_riot_")
+    lmm.API_BASE = base
+    lmm.LIMITER = lmm.RateLimiter() # fresh buckets, learns the mock's limits from the headers
+    lmm.SESSION.headers["X-Riot-Token"] = mock.key or "mock-key"
+    try:
+        log = io.StringIO()
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(log): # per-request retry messages
+            saved = lmm.sync_matches(mock.puuid, out_path=os.path.join(work, "raw.jsonl.gz"),
+                                     state_path=os.path.join(work, "sync.json"),
+                                     total=total or mock.n, queue=lmm.QUEUE_ID, workers=workers)
+        elapsed = time.perf_counter() - t0
+        with open(os.path.join(work, "sync.json"), encoding="utf-8") as f:
+            pending = len(json.load(f).get("pending", []))
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        shutil.rmtree(work, ignore_errors=True)
+
+    st = mock.stats()
+    ideal = min_seconds(st["accepted"], mock.app.limits)
+    return {**st, "workers": workers, "saved": saved, "pending": pending, "seconds": elapsed,
+            "matches_per_s": saved / elapsed if elapsed else 0.0,
+            "req_per_s": st["accepted"] / elapsed if elapsed else 0.0,
+            "min_seconds": ideal, "efficiency": ideal / elapsed if elapsed else 0.0}
+
+def bench(args):
+    mock_kw = dict(n_matches=args.matches, seed=args.seed, app_limits=args.app_limits,
+                   method_limits=args.method_limits, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                   error_rate=args.error_rate, drop_rate=args.drop_rate, throttle_rate=args.throttle_rate)
+    print(f"[mock] 매치 {args.matches}개, app {args.app_limits}, method {args.method_limits}, "
+          f"지연 {args.latency_ms:g}±{args.jitter_ms:g}ms, 5xx {args.error_rate:.1%}, 끊김 {args.drop_rate:.1%}, "
+          f"service 429 {args.throttle_rate:.1%}")
+    for w in args.workers:
+        r = run_fetch(mock_kw, workers=w)
+        peaks = "  ".join(f"{k}={v}" for k, v in r["peak_window"].items())
+        print(f"[fetch] workers={w:<3} 저장 {r['saved']}/{args.matches} (재시도 대기 {r['pending']})  "
+              f"{r['seconds']:6.1f}s  {r['matches_per_s']:6.1f} 매치/s  {r['req_per_s']:6.1f} req/s  "
+              f"한도 대비 {r['efficiency']:.0%} (최소 {r['min_seconds']:.1f}s)")
+        print(f"        429 app={r['429_app']} method={r['429_method']} service={r['429_service']}  "
+              f"5xx={r['5xx']}  끊김={r['dropped']}  최대 윈도 사용량 {peaks}")
+
+def main():
+    ap = argparse.ArgumentParser(description="Riot match-v5 mock 서버 / 수집기 부하 테스트")
+    ap.add_argument("cmd", nargs="?", choices=["serve", "bench"], default="serve")
+    ap.add_argument("--matches", type=int, default=1000, help="제공할 가짜 매치 수")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--port", type=int, default=PORT)
+    ap.add_argument("--key", help="serve: 이 키만 허용 (기본: 아무 키나)")
+    ap.add_argument("--app-limits", help=f"기본 serve {APP_LIMITS}, bench {BENCH_APP_LIMITS}")
+    ap.add_argument("--method-limits", default=METHOD_LIMITS)
+    ap.add_argument("--latency-ms", type=float, default=30.0)
+    ap.add_argument("--jitter-ms", type=float, default=10.0)
+    ap.add_argument("--error-rate", type=float, default=0.01, help="5xx 비율")
+    ap.add_argument("--drop-rate", type=float, default=0.005, help="응답 없이 연결 끊는 비율")
+    ap.add_argument("--throttle-rate", type=float, default=0.0, help="Retry-After 없는 service 429 비율")
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16], help="bench: 비교할 동시 요청 수")
+    args = ap.parse_args()
+
+    if args.cmd == "bench":
+        args.app_limits = args.app_limits or BENCH_APP_LIMITS
+        bench(args)
+        return
+    mock = MockRiot(args.matches, seed=args.seed, app_limits=args.app_limits or APP_LIMITS,
+                    method_limits=args.method_limits, key=args.key, latency_ms=args.latency_ms,
+                    jitter_ms=args.jitter_ms, error_rate=args.error_rate, drop_rate=args.drop_rate,
+                    throttle_rate=args.throttle_rate)
+    httpd = ThreadingHTTPServer((HOST, args.port), make_handler(mock))
+    httpd.daemon_threads = True
+    print(f"mock Riot API 실행: http://{HOST}:{args.port}  (puuid={mock.puuid})")
+    print(f"  python load_my_matches.py --api-base http://{HOST}:{args.port}  (RIOT_API_KEY, MY_PUUID 환경변수로 지정)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        print(json.dumps(mock.stats(), ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
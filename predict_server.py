@@ -0,0 +1,265 @@
+# predict_server.py
+import os, sys, json, time, queue, argparse, threading
+from collections import deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib import request as urlrequest
+
+CSV_PATH = "data/my_matches_ml.csv"
+MODEL_PATH = "data/my_win_model.joblib"
+HOST = "127.0.0.1"
+PORT = int(os.environ.get("ADC_PREDICT_PORT", 8766))
+MAX_BATCH = 256       # rows per predict_proba
+MAX_WAIT = 0.002      # seconds the batcher waits for more requests after the first one
+RELOAD_CHECK = 1.0    # seconds between model / CSV mtime checks
+
+# ---- resident model ----
+class ModelHolder:
+    """파이프라인 + 챔피언 기본값을 메모리에 유지. 모델/CSV 파일이 바뀌면 다시 로드 (hot reload)."""
+    def __init__(self, model_path, csv_path):
+        self.model_path = model_path
+        self.csv_path = csv_path
+        self.pipe = None
+        self.table = None
+        self.glob = None
+        self.sig = None
+        self.reloads = 0
+        self.loaded_at = None
+        self._checked = 0.0
+
+    def _sig(self):
+        sig = []
+        compiled_meta = os.path.join(os.path.splitext(self.model_path)[0] + ".compiled", "meta.json")
+        for p in (self.model_path, compiled_meta, self.csv_path):
+            try:
+                st = os.stat(p)
+                sig.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def maybe_reload(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._checked < RELOAD_CHECK:
+            return
+        self._checked = now
+        sig = self._sig()
+        if sig == self.sig:
+            return
+        import analyze_my_winrate as amw
+        from champ_stats import load_champ_summary
+        try:
+            pipe = amw.load_model(self.model_path, compiled=True) # flat arrays when compiled
+            summary = load_champ_summary(self.csv_path)
+        except Exception as e:
+            if self.pipe is None:
+                raise
+            print("모델 다시 로드 실패, 이전 모델 유지:", e, file=sys.stderr)
+            return
+        self.pipe = pipe
+        self.table = amw.defaults_table(summary)
+        self.glob = amw.get_feature_defaults(summary)
+        if self.sig is not None:
+            self.reloads += 1
+            print("모델 변경 감지 -> 다시 로드", file=sys.stderr)
+        self.sig = sig
+        self.loaded_at = time.time()
+
+    def predict(self, rows: list) -> list:
+        import pandas as pd
+        import analyze_my_winrate as amw
+        chunk = pd.DataFrame(rows)
+        if "champion" not in chunk.columns:
+            raise ValueError("'champion' 필드가 없습니다.")
+        X = amw.fill_features(chunk, self.table, self.glob)
+        proba = self.pipe.predict_proba(X[amw.CAT_COLS_ALL + amw.NUM_COLS_ALL])[:, 1]
+        return [{"prob_win": float(p), "pred_win": int(p >= 0.5), "fill": f}
+                for p, f in zip(proba, X["fill"])]
+
+# ---- micro-batching ----
+class Job:
+    __slots__ = ("rows", "done", "result", "error")
+    def __init__(self, rows):
+        self.rows = rows
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class Batcher:
+    """동시에 들어온 요청들을 모아 predict_proba 한 번으로 처리하는 스레드"""
+    def __init__(self, holder: ModelHolder):
+        self.holder = holder
+        self.jobs = queue.Queue()
+        self.latencies = deque(maxlen=10000) # ms per request, enqueue -> response
+        self.batches = 0
+        self.batched_rows = 0
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, daemon=True, name="batcher").start()
+
+    def submit(self, rows: list, timeout=10.0) -> list:
+        t0 = time.perf_counter()
+        job = Job(rows)
+        self.jobs.put(job)
+        if not job.done.wait(timeout):
+            raise TimeoutError("예측 대기 시간 초과")
+        with self._lock:
+            self.requests += 1
+            self.latencies.append((time.perf_counter() - t0) * 1000)
+            if job.error is not None:
+                self.errors += 1
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def _collect(self) -> list:
+        try:
+            batch = [self.jobs.get(timeout=RELOAD_CHECK)]
+        except queue.Empty:
+            return []
+        n = len(batch[0].rows)
+        deadline = time.perf_counter() + MAX_WAIT
+        while n < MAX_BATCH:
+            left = deadline - time.perf_counter()
+            try:
+                job = self.jobs.get(timeout=left) if left > 0 else self.jobs.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(job)
+            n += len(job.rows)
+        return batch
+
+    def _run(self):
+        while True:
+            self.holder.maybe_reload()
+            batch = self._collect()
+            if not batch:
+                continue
+            rows = [r for job in batch for r in job.rows]
+            try:
+                out = self.holder.predict(rows)
+            except Exception:
+                # one bad row must not fail its neighbours: retry each request alone
+                out = None
+            i = 0
+            for job in batch:
+                if out is not None:
+                    job.result = out[i:i + len(job.rows)]
+                else:
+                    try:
+                        job.result = self.holder.predict(job.rows)
+                    except Exception as e:
+                        job.error = e
+                i += len(job.rows)
+                job.done.set()
+            with self._lock:
+                self.batches += 1
+                self.batched_rows += len(rows)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lat = sorted(self.latencies)
+            def pct(q):
+                return round(lat[min(len(lat) - 1, int(q * len(lat)))], 3) if lat else None
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "queue_depth": self.jobs.qsize(),
+                "batches": self.batches,
+                "mean_batch_rows": round(self.batched_rows / self.batches, 2) if self.batches else 0,
+                "p50_ms": pct(0.50),
+                "p99_ms": pct(0.99),
+                "model_path": self.holder.model_path,
+                "model_loaded_at": self.holder.loaded_at,
+                "reloads": self.holder.reloads,
+            }
+
+# ---- HTTP ----
+def make_handler(batcher: Batcher):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1" # keep-alive for the GUI / client
+
+        def _send(self, code, obj):
+            body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/stats":
+                self._send(200, batcher.stats())
+            elif self.path == "/health":
+                self._send(200, {"ok": True})
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                return self._send(404, {"error": "not found"})
+            try:
+                payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                single = isinstance(payload, dict) and "rows" not in payload
+                rows = [payload] if single else payload["rows"] if isinstance(payload, dict) else payload
+                out = batcher.submit(rows)
+            except (ValueError, KeyError, TypeError) as e:
+                return self._send(400, {"error": str(e)})
+            except Exception as e:
+                return self._send(500, {"error": str(e)})
+            self._send(200, out[0] if single else {"results": out})
+
+        def log_message(self, fmt, *args):
+            pass # per-request access log would dominate the latency
+
+    return Handler
+
+def serve(model_path, csv_path, host=HOST, port=PORT):
+    holder = ModelHolder(model_path, csv_path)
+    holder.maybe_reload(force=True)
+    batcher = Batcher(holder)
+    httpd = ThreadingHTTPServer((host, port), make_handler(batcher))
+    httpd.daemon_threads = True
+    print(f"예측 서버 실행: http://{host}:{port}  (POST /predict, GET /stats)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+# ---- thin client (stdlib only, used by the GUI) ----
+def _call(path, payload=None, timeout=2.0, host=HOST, port=PORT):
+    url = f"http://{host}:{port}{path}"
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    req = urlrequest.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urlrequest.urlopen(req, timeout=timeout) as r:
+        return json.loads(r.read())
+
+def predict_rows(rows: list, timeout=2.0, **kw) -> list:
+    """서버에 예측 요청. 서버가 없으면 OSError (호출 쪽에서 로컬 모델로 대체)."""
+    return _call("/predict", {"rows": rows}, timeout, **kw)["results"]
+
+def server_stats(timeout=2.0, **kw) -> dict:
+    return _call("/stats", None, timeout, **kw)
+
+def main():
+    ap = argparse.ArgumentParser(description="로컬 예측 서버 / 클라이언트")
+    ap.add_argument("cmd", nargs="?", choices=["serve", "predict", "stats"], default="serve")
+    ap.add_argument("rows", nargs="*", help="predict: JSON 행 (예: '{\"champion\": \"Jinx\"}')")
+    ap.add_argument("--model", default=MODEL_PATH)
+    ap.add_argument("--csv", default=CSV_PATH)
+    ap.add_argument("--port", type=int, default=PORT)
+    args = ap.parse_args()
+
+    if args.cmd == "serve":
+        serve(args.model, args.csv, port=args.port)
+    elif args.cmd == "stats":
+        print(json.dumps(server_stats(port=args.port), ensure_ascii=False, indent=1))
+    else:
+        rows = [json.loads(r) for r in args.rows] or [json.loads(line) for line in sys.stdin if line.strip()]
+        for row, res in zip(rows, predict_rows(rows, port=args.port)):
+            print(f"[PREDICT] {row.get('champion')}: prob_win={res['prob_win']*100:.1f}%  pred_win={res['pred_win']}  (fill={res['fill'] or 'none'})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import re, sys, time, argparse, statistics, subprocess
+
+GUI_SCRIPT = "lol-adc-builder-helper.py"
+STARTUP_RE = re.compile(r"\[startup\] 첫 화면 (\d+) ms, 그리드 완성 (\d+) ms.*import (\d+) ms")
+
+# ---- run the GUI ----
+def run_once(script=GUI_SCRIPT, importtime=False, timeout=120) -> dict:
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += [script, "--exit-after-startup"]
+
+    t0 = time.perf_counter()
+    p = subprocess.run(cmd, capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=timeout)
+    wall = (time.perf_counter() - t0) * 1000
+
+    m = STARTUP_RE.search(p.stdout)
+    if p.returncode != 0 or m is None:
+        raise RuntimeError(f"GUI 시작 실패 (exit {p.returncode}):\n{p.stderr[-2000:]}")
+    return {
+        "first_frame": int(m.group(1)),
+        "grid": int(m.group(2)),
+        "imports": int(m.group(3)),
+        "wall": wall,
+        "stderr": p.stderr,
+    }
+
+# ---- -X importtime ----
+def parse_importtime(stderr: str) -> list:
+    """'import time: self | cumulative | name' 줄 -> [(name, depth, self_us, cumulative_us)]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue # header line
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2 # two spaces per nesting level
+        rows.append((name.strip(), depth, self_us, cum_us))
+    return rows
+
+def top_imports(rows: list, n=15) -> list:
+    # top-level imports of the script, most expensive first
+    top = [r for r in rows if r[1] == 0]
+    return sorted(top, key=lambda r: r[3], reverse=True)[:n]
+
+def main():
+    ap = argparse.ArgumentParser(description="GUI 콜드 스타트 시간 측정")
+    ap.add_argument("--runs", type=int, default=5, help="반복 실행 횟수")
+    ap.add_argument("--script", default=GUI_SCRIPT)
+    ap.add_argument("--top", type=int, default=15, help="import 상위 N개 표시")
+    args = ap.parse_args()
+
+    # 1) import breakdown, one run under -X importtime
+    first = run_once(args.script, importtime=True)
+    rows = parse_importtime(first["stderr"])
+    total = sum(r[3] for r in rows if r[1] == 0)
+    print(f"[import] 총 {total / 1000:.0f} ms, {len(rows)}개 모듈")
+    for name, _, self_us, cum_us in top_imports(rows, args.top):
+        print(f"  {cum_us / 1000:8.1f} ms  (self {self_us / 1000:6.1f})  {name}")
+
+    # 2) wall-clock start-up, median of N plain runs
+    runs = [run_once(args.script) for _ in range(args.runs)]
+    for key, label in [("imports", "import"), ("first_frame", "첫 화면"), ("grid", "그리드 완성"), ("wall", "프로세스 전체")]:
+        vals = [r[key] for r in runs]
+        print(f"[startup] 중앙값 {statistics.median(vals):7.0f} ms  (최소 {min(vals):.0f}, 최대 {max(vals):.0f})  {label}")
+
+if __name__ == "__main__":
+    main()
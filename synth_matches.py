@@ -0,0 +1,167 @@
+# synth_matches.py
+import os, json, random, argparse
+from match_store import MatchStore
+
+# ---- synthetic match-v5 data (benchmarks / load tests, no API key needed) ----
+SYNTH_PUUID = "synthetic-puuid-0000000000000000000000000000000000000000000000000000000000000000"
+PLATFORM = "KR"
+FIRST_MATCH_NO = 7000000000
+FIRST_GAME_START = 1736294400 * 1000 # season 15 start, ms
+GAME_INTERVAL_MS = 45 * 60 * 1000     # match i starts at FIRST_GAME_START + i * GAME_INTERVAL_MS
+
+ADC_CHAMPS = ["Jinx", "Ezreal", "KaiSa", "Caitlyn", "Jhin", "Varus", "Ashe", "Lucian", "MissFortune",
+              "Xayah", "Aphelios", "Zeri", "Samira", "Draven", "Vayne", "Tristana", "Sivir", "Twitch",
+              "KogMaw", "Kalista", "Smolder", "Corki", "Nilah", "Ziggs", "Senna", "Azir"]
+OTHER_CHAMPS = ["Thresh", "Nautilus", "Lulu", "Nami", "Leona", "Rakan", "Ahri", "Syndra", "Orianna", "Viktor",
+                "LeeSin", "Vi", "Viego", "Graves", "Aatrox", "Jax", "Camille", "Renekton", "KSante", "Gnar"]
+CHAMP_IDS = {c: 1 + i for i, c in enumerate(ADC_CHAMPS + OTHER_CHAMPS)} # stable, unlike hash()
+POSITIONS = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
+PATCHES = ["15.1", "15.2", "15.3", "15.4", "15.5", "15.6", "15.7", "15.8"]
+RUNE_STYLES = [8000, 8100, 8200, 8300, 8400]
+KEYSTONES = {8000: [8005, 8008, 8021, 8010], 8100: [8112, 8128, 9923], 8200: [8214, 8229, 8230],
+             8300: [8351, 8360, 8369], 8400: [8437, 8439, 8465]}
+CORE_ITEMS = [3031, 3032, 3033, 3036, 3046, 3072, 3085, 3087, 3094, 3095, 3124, 3153, 3508, 6672, 6673, 6675, 6676]
+MINOR_ITEMS = [1036, 1037, 1038, 1042, 1053, 1055, 2003, 2055, 3006, 3009, 3020, 3047, 3086, 3133]
+TRINKETS = [3340, 3363, 3364]
+# a real participant carries ~120 challenge counters; enough of them to make the payload realistic
+CHALLENGE_KEYS = ["killParticipation", "kda", "damagePerMinute", "goldPerMinute", "teamDamagePercentage",
+                  "visionScorePerMinute", "laneMinionsFirst10Minutes", "maxCsAdvantageOnLaneOpponent",
+                  "skillshotsHit", "skillshotsDodged", "soloKills", "takedowns", "turretPlatesTaken",
+                  "controlWardsPlaced", "wardTakedowns", "effectiveHealAndShielding", "enemyChampionImmobilizations",
+                  "multikills", "killingSprees", "abilityUses", "dodgeSkillShotsSmallWindow", "bountyGold",
+                  "damageTakenOnTeamPercentage", "earliestDragonTakedown", "epicMonsterSteals", "firstTurretKilled",
+                  "gameLength", "immobilizeAndKillWithAlly", "initialBuffCount", "jungleCsBefore10Minutes",
+                  "kTurretsDestroyedBeforePlatesFall", "killAfterHiddenWithAlly", "killsNearEnemyTurret",
+                  "knockEnemyIntoTeamAndKill", "landSkillShotsEarlyGame", "legendaryCount", "lostAnInhibitor",
+                  "maxKillDeficit", "moreEnemyJungleThanOpponent", "outnumberedKills", "perfectGame",
+                  "pickKillWithAlly", "quickCleanse", "quickSoloKills", "saveAllyFromDeath", "scuttleCrabKills",
+                  "stealthWardsPlaced", "survivedSingleDigitHpCount", "teamBaronKills", "teleportTakedowns",
+                  "turretTakedowns", "visionScoreAdvantageLaneOpponent", "wardsGuarded", "twentyMinionsIn3SecondsCount"]
+
+def _participant(rng, puuid, champ, position, team_id, win, dur, skill):
+    mins = dur / 60.0
+    carry = position == "BOTTOM"
+    perf = rng.gauss(skill + (0.35 if win else -0.35), 0.6) # wins come with better numbers
+    kills = max(0, int(rng.gauss(6 + 2.5 * perf, 3) if carry else rng.gauss(3 + perf, 2)))
+    deaths = max(0, int(rng.gauss(5 - 1.5 * perf, 2)))
+    assists = max(0, int(rng.gauss(7 + perf, 3)))
+    cs = max(0, int(mins * (rng.gauss(7.3 + 0.6 * perf, 0.8) if carry else rng.gauss(3.5, 2.5))))
+    gold = int(mins * rng.gauss(420 + 30 * perf, 40))
+    dmg = int(mins * rng.gauss(720 + 120 * perf if carry else 500, 110))
+    xp = int(mins * rng.gauss(420, 30))
+    primary = rng.choice(RUNE_STYLES[:2] if carry else RUNE_STYLES)
+    sub = rng.choice([s for s in RUNE_STYLES if s != primary])
+    n_core = min(3, int(mins // 11))
+    items = rng.sample(CORE_ITEMS, n_core) + rng.sample(MINOR_ITEMS, 6 - n_core - 1) + [rng.choice([3006, 3009, 3047])]
+    rng.shuffle(items)
+    challenges = {k: round(rng.random() * 10, 4) for k in CHALLENGE_KEYS}
+    challenges["killParticipation"] = round(min(1.0, max(0.0, rng.gauss(0.5 + 0.05 * perf, 0.12))), 4)
+    return {
+        "puuid": puuid,
+        "allInPings": rng.randint(0, 5), "assistMePings": rng.randint(0, 5),
+        "assists": assists, "baronKills": rng.randint(0, 1),
+        "champExperience": xp, "champLevel": min(18, 6 + int(mins / 2.5)),
+        "championId": CHAMP_IDS[champ], "championName": champ,
+        "damageDealtToBuildings": rng.randint(0, 9000), "damageDealtToObjectives": rng.randint(0, 20000),
+        "damageSelfMitigated": rng.randint(2000, 30000),
+        "deaths": deaths, "detectorWardsPlaced": rng.randint(0, 4),
+        "goldEarned": gold, "goldSpent": int(gold * 0.93),
+        "individualPosition": position, "lane": position if position != "UTILITY" else "BOTTOM",
+        **{f"item{i}": items[i] for i in range(6)}, "item6": rng.choice(TRINKETS),
+        "kills": kills, "largestKillingSpree": rng.randint(0, kills + 1),
+        "magicDamageDealtToChampions": dmg // 5, "physicalDamageDealtToChampions": dmg - dmg // 5,
+        "neutralMinionsKilled": rng.randint(0, 12) if carry else rng.randint(0, 150),
+        "perks": {
+            "statPerks": {"defense": 5011, "flex": 5008, "offense": 5005},
+            "styles": [
+                {"description": "primaryStyle", "style": primary,
+                 "selections": [{"perk": rng.choice(KEYSTONES[primary]), "var1": rng.randint(0, 2000), "var2": 0, "var3": 0}
+                                for _ in range(4)]},
+                {"description": "subStyle", "style": sub,
+                 "selections": [{"perk": rng.choice(KEYSTONES[sub]), "var1": rng.randint(0, 500), "var2": 0, "var3": 0}
+                                for _ in range(2)]},
+            ],
+        },
+        "role": "CARRY" if carry else "SOLO", "teamId": team_id, "teamPosition": position,
+        "totalDamageDealtToChampions": dmg, "totalDamageTaken": rng.randint(8000, 40000),
+        "totalMinionsKilled": cs, "visionScore": max(0, int(mins * rng.gauss(0.8, 0.3))),
+        "wardsKilled": rng.randint(0, 8), "wardsPlaced": rng.randint(3, 20),
+        "win": win,
+        "challenges": challenges,
+    }
+
+def make_match(i: int, puuid=SYNTH_PUUID, seed=0, n_matches=1000) -> dict:
+    """i 번째 가짜 매치 (같은 i, seed 면 항상 같은 내용). puuid 는 매번 블루/레드 중 한쪽 원딜로 참가."""
+    rng = random.Random(seed * 1_000_003 + i)
+    dur = int(rng.gauss(1750, 300))
+    patch = PATCHES[min(len(PATCHES) - 1, i * len(PATCHES) // max(n_matches, 1))] # patches advance with time
+    my_team = rng.choice([100, 200])
+    my_win = rng.random() < 0.52
+    # a personal pool: a few mains, a long tail
+    my_champ = ADC_CHAMPS[min(int(rng.expovariate(0.35)), len(ADC_CHAMPS) - 1)]
+    my_skill = 0.25 * (ADC_CHAMPS.index(my_champ) < 4) # better on the mains
+
+    picks = rng.sample(ADC_CHAMPS, 3) + rng.sample(OTHER_CHAMPS, 8)
+    participants = []
+    for team_id in (100, 200):
+        win = my_win if team_id == my_team else not my_win
+        for pos in POSITIONS:
+            if team_id == my_team and pos == "BOTTOM":
+                pid, champ, skill = puuid, my_champ, my_skill
+            else:
+                pid = f"synthetic-{rng.getrandbits(128):032x}"
+                champ = picks.pop() if pos == "BOTTOM" or rng.random() < 0.5 else picks.pop(0)
+                skill = 0.0
+            participants.append(_participant(rng, pid, champ, pos, team_id, win, dur, skill))
+
+    match_no = FIRST_MATCH_NO + i
+    start = FIRST_GAME_START + i * GAME_INTERVAL_MS
+    return {
+        "metadata": {"dataVersion": "2", "matchId": f"{PLATFORM}_{match_no}",
+                     "participants": [p["puuid"] for p in participants]},
+        "info": {
+            "endOfGameResult": "GameComplete",
+            "gameCreation": start - 60000, "gameDuration": dur, "gameEndTimestamp": start + dur * 1000,
+            "gameId": match_no, "gameMode": "CLASSIC", "gameName": f"teambuilder-match-{match_no}",
+            "gameStartTimestamp": start, "gameType": "MATCHED_GAME",
+            "gameVersion": f"{patch}.{600 + i % 50}.{1000 + i % 900}",
+            "mapId": 11, "participants": participants, "platformId": f"{PLATFORM}", "queueId": 420,
+            "teams": [{"teamId": t, "win": (t == my_team) == my_win,
+                       "bans": [{"championId": rng.randint(1, 900), "pickTurn": k + 1} for k in range(5)],
+                       "objectives": {o: {"first": rng.random() < 0.5, "kills": rng.randint(0, 4)}
+                                      for o in ("baron", "champion", "dragon", "horde", "inhibitor", "riftHerald", "tower")}}
+                      for t in (100, 200)],
+            "tournamentCode": "",
+        },
+    }
+
+def write_matches(n: int, out_path: str, puuid=SYNTH_PUUID, seed=0, progress=True) -> str:
+    """n 개 매치를 .jsonl 또는 MatchStore(.jsonl.gz + .idx) 로 저장"""
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    step = max(1, n // 20)
+    if out_path.endswith(".jsonl.gz"):
+        with MatchStore(out_path) as store:
+            for i in range(n):
+                store.append(make_match(i, puuid, seed, n))
+                if progress and (i + 1) % step == 0:
+                    print(f"  {i + 1}/{n}")
+    else:
+        with open(out_path, "w", encoding="utf-8") as f:
+            for i in range(n):
+                f.write(json.dumps(make_match(i, puuid, seed, n), ensure_ascii=False) + "\n")
+                if progress and (i + 1) % step == 0:
+                    print(f"  {i + 1}/{n}")
+    return out_path
+
+def main():
+    ap = argparse.ArgumentParser(description="가짜 match-v5 데이터 생성")
+    ap.add_argument("--matches", type=int, default=1000, help="매치 수 (1k ~ 1M)")
+    ap.add_argument("--out", default="data/synth/my_matches_raw.jsonl.gz", help=".jsonl 또는 .jsonl.gz (MatchStore)")
+    ap.add_argument("--puuid", default=SYNTH_PUUID)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+    write_matches(args.matches, args.out, args.puuid, args.seed)
+    print(f"생성 완료: {args.out} ({args.matches} 매치, puuid={args.puuid[:24]}...)")
+
+if __name__ == "__main__":
+    main()
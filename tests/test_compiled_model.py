@@ -0,0 +1,60 @@
+import os, sys
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import analyze_my_winrate as amw
+from compiled_model import CompiledModel
+
+def make_df(n, seed=0, nan_frac=0.0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "champion": rng.choice(["Jinx", "Ezreal", "KaiSa", "Ashe"], n),
+        "role": rng.choice(["ADC", "MID"], n),
+        "runePrimary": rng.choice([8000, 8100], n),
+        "runeSub": rng.choice([8200, 8300], n),
+        "queueId": rng.choice([420, 440], n),
+        "patch": rng.choice(["15.1", "15.2"], n),
+        **{c: rng.normal(5, 2, n) for c in amw.NUM_COLS_ALL},
+    })
+    df["win"] = ((df["kills"] - df["deaths"] + rng.normal(0, 1, n)) > 0).astype(int)
+    if nan_frac:
+        for c in amw.NUM_COLS_ALL:
+            df.loc[rng.random(n) < nan_frac, c] = np.nan
+    return df
+
+def fit(df):
+    pipe = amw.build_pipeline(amw.CAT_COLS_ALL, amw.NUM_COLS_ALL)
+    pipe.set_params(clf__n_estimators=25, clf__n_jobs=1)
+    return pipe.fit(df[amw.CAT_COLS_ALL + amw.NUM_COLS_ALL], df["win"])
+
+def unknown_rows(X):
+    unk = X.head(30).copy() # unseen champion / patch -> all-zero one-hot, like handle_unknown="ignore"
+    unk["champion"] = "__unknown__"
+    unk["patch"] = "0.0"
+    return unk
+
+def nan_rows(X):
+    nan = X.head(30).copy()
+    for i, c in enumerate(amw.NUM_COLS_ALL):
+        nan.iloc[i::len(amw.NUM_COLS_ALL), nan.columns.get_loc(c)] = np.nan
+    nan.iloc[::5, [nan.columns.get_loc(c) for c in amw.NUM_COLS_ALL]] = np.nan # all numbers missing
+    return nan
+
+# trained without NaN (missing values follow the bigger child) and with NaN (learned per split)
+@pytest.mark.parametrize("nan_frac", [0.0, 0.2])
+def test_compiled_matches_sklearn(tmp_path, nan_frac):
+    df = make_df(300, nan_frac=nan_frac)
+    pipe = fit(df)
+    X = df[amw.CAT_COLS_ALL + amw.NUM_COLS_ALL]
+    X = pd.concat([X, unknown_rows(X), nan_rows(X)], ignore_index=True)
+
+    cm = CompiledModel.from_pipeline(pipe)
+    expected = pipe.predict_proba(X)
+    assert np.array_equal(cm.predict_proba(X), expected)
+
+    # same result after a save / load round trip
+    path = str(tmp_path / "model.compiled")
+    cm.save(path)
+    assert np.array_equal(CompiledModel.load(path).predict_proba(X), expected)
@@ -0,0 +1,49 @@
+import os, sys
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import analyze_my_winrate as amw
+
+GRID = {"clf__n_estimators": [10, 20], "clf__max_depth": [3, 5], "clf__min_samples_leaf": [1, 3]}
+
+def make_df(n, start=0, champs=("Jinx", "Ezreal", "KaiSa"), seed=0, win=None):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "matchId": [f"KR_{7000000000 + start + i}" for i in range(n)],
+        "champion": rng.choice(list(champs), n),
+        "role": "ADC",
+        "runePrimary": rng.choice([8000, 8100], n),
+        "runeSub": rng.choice([8200, 8300], n),
+        "queueId": 420,
+        "patch": "15.1",
+        **{c: rng.normal(5, 2, n) for c in amw.NUM_COLS_ALL},
+    })
+    df["win"] = (df["kills"] > df["deaths"]).astype(int) if win is None else win
+    return df
+
+@pytest.mark.parametrize("case", ["new_champion", "one_class_window"])
+def test_full_refresh_keeps_searched_params(tmp_path, monkeypatch, case):
+    monkeypatch.chdir(tmp_path) # search cache / model live under ./data
+    model_path = os.path.join("data", "model.joblib")
+    df = make_df(240)
+
+    # search -> apply
+    _, best, _, _ = amw.search(df, folds=3, grid=GRID, n_jobs=1)
+    amw.train_and_eval(df, save_model=True, model_path=model_path, clf_params=best)
+    assert amw.load_model_meta(model_path)["clf_params"] == {**amw.saved_clf_params(model_path), **best}
+
+    # new games that force the full-retrain branch
+    if case == "new_champion":
+        new = make_df(40, start=240, champs=("Smolder",), seed=1)
+        r = amw.refresh_model(pd.concat([df, new], ignore_index=True), model_path)
+    else:
+        new = make_df(40, start=240, seed=1, win=1)
+        r = amw.refresh_model(pd.concat([df, new], ignore_index=True), model_path, window=0)
+    assert r["mode"] == "full"
+
+    clf = amw.load_model(model_path).named_steps["clf"]
+    for k, v in best.items():
+        assert clf.get_params()[k] == v
+    assert amw.load_model_meta(model_path)["clf_params"]["n_estimators"] == best["n_estimators"]